@@ -6,6 +6,8 @@ Uses MediaPipe for hand tracking and OpenCV for rendering.
 
 import cv2
 import numpy as np
+import queue
+import threading
 import time
 from typing import Optional
 
@@ -22,9 +24,14 @@ class AirCanvas:
     def __init__(self):
         """Initialize the Air Canvas application."""
         print("Initializing Air Canvas...")
-        
+
         # Initialize camera
         self.camera = cv2.VideoCapture(CAMERA_INDEX)
+        # Keep only the newest frame in the driver buffer (default is ~4 frames,
+        # which adds ~100 ms of latency between hand motion and drawn strokes)
+        self.camera.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        # Request MJPG so the driver skips the YUYV->BGR conversion where supported
+        self.camera.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
         self.camera.set(cv2.CAP_PROP_FRAME_WIDTH, CAMERA_WIDTH)
         self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, CAMERA_HEIGHT)
         
@@ -45,13 +52,45 @@ class AirCanvas:
         self.gesture_guide = GestureGuide(CANVAS_WIDTH, CANVAS_HEIGHT)
         
         print("All components initialized")
-        
+
+        # One-shot gesture actions, fired only on gesture transitions
+        self._edge_actions = {
+            "Undo": self.canvas.undo,
+            "Redo": self.canvas.redo,
+            "Clear": self.canvas.clear,
+            "ChangeColor": self.canvas.cycle_color,
+        }
+
         # State variables
         self.running = True
         self.last_gesture = "None"
         self.fps = 0
         self.frame_count = 0
         self.start_time = time.time()
+
+        # Cached FPS/info text strip: the text is re-rasterized only when its
+        # content actually changes (~once per second) instead of every frame
+        self._info_strip = np.full((30, CANVAS_WIDTH, 3), CANVAS_BG_COLOR, dtype=np.uint8)
+        # Glyph mask rebuilt with the strip so the per-frame blit only
+        # touches text pixels, never user ink behind the counter
+        self._info_mask = np.zeros((30, CANVAS_WIDTH, 1), dtype=bool)
+        self._info_strip_y = CANVAS_HEIGHT - GESTURE_BAR_HEIGHT - 32
+        self._last_info_key = None
+
+        # Frame-skip state: hand detection runs every FRAME_SKIP+1 frames and
+        # the cursor is linearly extrapolated on the frames in between
+        self._frame_idx = 0
+        self._last_hand_landmarks = None
+        self._last_gesture_info = {'gesture': 'None', 'position': None,
+                                   'hand_landmarks': None, 'confidence': 0.0}
+        self._last_velocity = (0, 0)
+
+        # Frame queue feeding the main loop from the capture thread.
+        # Holds only the newest frame: the reader drops the pending one when
+        # the main loop falls behind, so hand tracking never runs on a stale
+        # frame after a CPU hiccup.
+        self.frame_queue: "queue.Queue[Optional[np.ndarray]]" = queue.Queue(maxsize=1)
+        self.capture_thread: Optional[threading.Thread] = None
         
         # Mouse callback for toolbar interaction
         cv2.namedWindow(WINDOW_NAME)
@@ -92,48 +131,58 @@ class AirCanvas:
             gesture: Gesture name
             position: Hand position (x, y)
         """
-        # Only process gesture changes to avoid repeated actions
-        gesture_changed = (gesture != self.last_gesture)
-        
         if gesture == "Draw" and position:
             # Start or continue drawing
             if not self.canvas.is_drawing:
                 self.canvas.start_stroke()
             self.canvas.add_point(position[0], position[1])
-        
-        elif gesture == "Move":
-            # Stop drawing but show cursor position
-            if self.canvas.is_drawing:
-                self.canvas.end_stroke()
-        
-        elif gesture == "Pause":
-            # Stop drawing
-            if self.canvas.is_drawing:
-                self.canvas.end_stroke()
-        
-        elif gesture == "Undo" and gesture_changed:
-            # Undo last stroke
-            self.canvas.undo()
-        
-        elif gesture == "Redo" and gesture_changed:
-            # Redo last undone stroke
-            self.canvas.redo()
-        
-        elif gesture == "Clear" and gesture_changed:
-            # Clear canvas
-            self.canvas.clear()
-        
-        elif gesture == "ChangeColor" and gesture_changed:
-            # Cycle to next color
-            self.canvas.cycle_color()
-        
         else:
-            # No recognized gesture - stop drawing
-            if self.canvas.is_drawing and gesture != "Draw":
+            # Any non-drawing gesture ends the current stroke
+            if self.canvas.is_drawing:
                 self.canvas.end_stroke()
-        
+
+            # One-shot actions fire only when the gesture changes,
+            # via a dict lookup instead of a string-compare chain
+            if gesture != self.last_gesture:
+                action = self._edge_actions.get(gesture)
+                if action is not None:
+                    action()
+
         self.last_gesture = gesture
     
+    def _capture_loop(self):
+        """
+        Capture thread: read and flip frames, hand them to the main loop.
+
+        Runs camera I/O concurrently with hand tracking and rendering so
+        camera.read() no longer blocks the processing of the previous frame.
+        Puts None on the queue when the camera fails so the main loop exits.
+        """
+        while self.running:
+            ret, frame = self.camera.read()
+            if ret:
+                # Flip frame horizontally for mirror effect
+                frame = cv2.flip(frame, 1)
+            else:
+                frame = None  # Signals the main loop to exit
+
+            # Drop-oldest put: replace any frame the main loop has not
+            # consumed yet so it always sees the newest one
+            try:
+                self.frame_queue.put_nowait(frame)
+            except queue.Full:
+                try:
+                    self.frame_queue.get_nowait()
+                except queue.Empty:
+                    pass
+                try:
+                    self.frame_queue.put_nowait(frame)
+                except queue.Full:
+                    pass
+
+            if frame is None:
+                break
+
     def _calculate_fps(self):
         """Calculate and update FPS."""
         self.frame_count += 1
@@ -159,21 +208,60 @@ class AirCanvas:
         print("\nYou can also click on the toolbar to change colors or use buttons.")
         print("-" * 60)
         
+        # Start the capture thread (daemon so it never blocks interpreter exit)
+        self.capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
+        self.capture_thread.start()
+
         while self.running:
-            # Read camera frame
-            ret, camera_frame = self.camera.read()
-            if not ret:
+            # Get the next camera frame from the capture thread
+            try:
+                camera_frame = self.frame_queue.get(timeout=1.0)
+            except queue.Empty:
+                continue
+
+            if camera_frame is None:
                 print("Failed to read from camera")
                 break
-            
-            # Flip frame horizontally for mirror effect
-            camera_frame = cv2.flip(camera_frame, 1)
-            
-            # Process hand tracking
-            hand_landmarks, gesture_info = self.hand_tracker.process_frame(camera_frame)
-            
-            gesture = gesture_info['gesture']
-            position = gesture_info['position']
+
+            self._frame_idx += 1
+            step = self._frame_idx % (FRAME_SKIP + 1)
+            if FRAME_SKIP > 0 and step != 0:
+                # Skipped frame: reuse the last gesture and extrapolate the
+                # cursor along the last observed per-frame fingertip
+                # velocity, advanced by how many frames have passed since
+                # the last detection (step is 1..FRAME_SKIP here)
+                hand_landmarks = self._last_hand_landmarks
+                gesture_info = self._last_gesture_info
+                gesture = gesture_info['gesture']
+                position = gesture_info['position']
+                if position is not None:
+                    position = (
+                        max(0, min(int(position[0] + self._last_velocity[0] * step),
+                                   CANVAS_WIDTH - 1)),
+                        max(0, min(int(position[1] + self._last_velocity[1] * step),
+                                   CANVAS_HEIGHT - 1))
+                    )
+            else:
+                # Hand tracking (the tracker downscales internally per
+                # HAND_TRACKING_SCALE; the full-res frame is kept for the preview)
+                hand_landmarks, gesture_info = self.hand_tracker.process_frame(camera_frame)
+
+                gesture = gesture_info['gesture']
+                position = gesture_info['position']
+
+                last_position = self._last_gesture_info['position']
+                if position is not None and last_position is not None:
+                    # Detections are FRAME_SKIP + 1 frames apart; divide the
+                    # observed delta down to a per-frame velocity so the
+                    # extrapolated cursor never overshoots the next detection
+                    self._last_velocity = (
+                        (position[0] - last_position[0]) / (FRAME_SKIP + 1),
+                        (position[1] - last_position[1]) / (FRAME_SKIP + 1)
+                    )
+                else:
+                    self._last_velocity = (0, 0)
+                self._last_hand_landmarks = hand_landmarks
+                self._last_gesture_info = gesture_info
             
             # Handle gesture
             self._handle_gesture(gesture, position)
@@ -199,10 +287,11 @@ class AirCanvas:
             
             # Draw camera preview
             display = self.camera_preview.draw(
-                display, 
+                display,
                 camera_frame,
                 hand_landmarks,
-                self.hand_tracker
+                self.hand_tracker,
+                gesture
             )
             
             # Draw cursor position indicator when in Move mode
@@ -210,11 +299,24 @@ class AirCanvas:
                 cv2.circle(display, position, 10, HIGHLIGHT_COLOR, 2)
                 cv2.circle(display, position, 3, HIGHLIGHT_COLOR, -1)
             
-            # Draw FPS and info
+            # Draw FPS and info via the cached strip, re-rendered only when
+            # the displayed values change
             self._calculate_fps()
-            info_text = f"FPS: {self.fps:.1f} | Gesture: {gesture} | Color: {self.canvas.get_current_color_name()}"
-            cv2.putText(display, info_text, (10, CANVAS_HEIGHT - GESTURE_BAR_HEIGHT - 10),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, TEXT_COLOR, 1, cv2.LINE_AA)
+            color_name = self.canvas.get_current_color_name()
+            info_key = (round(self.fps, 1), gesture, color_name)
+            if info_key != self._last_info_key:
+                self._info_strip[:] = CANVAS_BG_COLOR
+                info_text = f"FPS: {self.fps:.1f} | Gesture: {gesture} | Color: {color_name}"
+                cv2.putText(self._info_strip, info_text, (10, 22),
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.6, TEXT_COLOR, 1, cv2.LINE_AA)
+                self._info_mask = (
+                    self._info_strip != np.array(CANVAS_BG_COLOR, dtype=np.uint8)
+                ).any(axis=2)[..., None]
+                self._last_info_key = info_key
+            # Masked copy: only the glyph pixels land on the display, like
+            # the toolbar's descender blit, so ink under the counter survives
+            np.copyto(display[self._info_strip_y:self._info_strip_y + 30],
+                      self._info_strip, where=self._info_mask)
             
             # Show display
             cv2.imshow(WINDOW_NAME, display)
@@ -235,6 +337,14 @@ class AirCanvas:
     def cleanup(self):
         """Clean up resources."""
         print("Cleaning up...")
+        self.running = False
+        if self.capture_thread is not None and self.capture_thread.is_alive():
+            # Unblock the capture thread if it is waiting on a full queue
+            try:
+                self.frame_queue.get_nowait()
+            except queue.Empty:
+                pass
+            self.capture_thread.join(timeout=1.0)
         self.camera.release()
         self.hand_tracker.release()
         cv2.destroyAllWindows()
@@ -5,50 +5,77 @@ Handles drawing strokes, colors, brush sizes, and undo/redo functionality.
 
 import cv2
 import numpy as np
-from typing import List, Tuple, Optional
+from collections import deque
+from itertools import islice
+from typing import Deque, List, Tuple, Optional
 from config import *
+from filters import OneEuroFilter
 
 
 class Stroke:
     """Represents a single drawing stroke."""
     
+    # Initial capacity of the point buffer; doubled on overflow
+    _INITIAL_CAPACITY = 64
+
     def __init__(self, color: Tuple[int, int, int], size: int):
         """
         Initialize a stroke.
-        
+
         Args:
             color: BGR color
             size: Brush size
         """
-        self.points: List[Tuple[int, int]] = []
+        # Packed (N, 2) int32 buffer instead of a list of tuples: ~20x less
+        # memory per point and contiguous for cv2.polylines
+        self._pts = np.empty((self._INITIAL_CAPACITY, 2), dtype=np.int32)
+        self._n = 0
         self.color = color
         self.size = size
-    
+
+    def __len__(self) -> int:
+        return self._n
+
+    @property
+    def points(self) -> np.ndarray:
+        """The recorded points as an (N, 2) int32 array view."""
+        return self._pts[:self._n]
+
+    @property
+    def last_point(self) -> Optional[Tuple[int, int]]:
+        """The most recently added point, or None for an empty stroke."""
+        if self._n == 0:
+            return None
+        return int(self._pts[self._n - 1, 0]), int(self._pts[self._n - 1, 1])
+
     def add_point(self, x: int, y: int):
         """Add a point to the stroke."""
-        self.points.append((x, y))
-    
+        if self._n == len(self._pts):
+            grown = np.empty((len(self._pts) * 2, 2), dtype=np.int32)
+            grown[:self._n] = self._pts
+            self._pts = grown
+        self._pts[self._n, 0] = x
+        self._pts[self._n, 1] = y
+        self._n += 1
+
     def draw(self, canvas: np.ndarray):
         """
         Draw the stroke on the canvas.
-        
+
         Args:
             canvas: Canvas to draw on
         """
-        if len(self.points) < 2:
+        if self._n < 2:
             # Draw a single point
-            if len(self.points) == 1:
-                cv2.circle(canvas, self.points[0], self.size, self.color, -1)
+            if self._n == 1:
+                cv2.circle(canvas, self.last_point, self.size, self.color, -1)
             return
-        
-        # Draw lines between consecutive points
-        for i in range(1, len(self.points)):
-            if ANTI_ALIAS:
-                cv2.line(canvas, self.points[i-1], self.points[i], 
-                        self.color, self.size * LINE_THICKNESS_MULTIPLIER, cv2.LINE_AA)
-            else:
-                cv2.line(canvas, self.points[i-1], self.points[i], 
-                        self.color, self.size * LINE_THICKNESS_MULTIPLIER)
+
+        # Draw all segments in a single native call instead of one
+        # Python-level cv2.line call per segment
+        line_type = cv2.LINE_AA if ANTI_ALIAS else cv2.LINE_8
+        cv2.polylines(canvas, [self._pts[:self._n]], False, self.color,
+                      self.size * LINE_THICKNESS_MULTIPLIER, line_type)
 
 
 class Canvas:
@@ -67,72 +94,114 @@ class Canvas:
         self.height = height
         self.bg_color = bg_color
         
+        # Committed canvas: every finished stroke is rasterized onto it once
+        # in end_stroke, so the display path never re-renders old strokes.
         self.canvas = np.full((height, width, 3), bg_color, dtype=np.uint8)
-        
-        self.strokes: List[Stroke] = []
-        self.undo_stack: List[Stroke] = []
-        
+
+        # Deques make evicting the oldest stroke O(1); a plain list shifts
+        # every remaining element on pop(0).
+        self.strokes: Deque[Stroke] = deque()
+        self.undo_stack: Deque[Stroke] = deque()
+
+        # Base canvas holding strokes that were evicted from the undo history
+        # (they can no longer be undone, so they are baked in permanently).
+        self._base_canvas = np.full((height, width, 3), bg_color, dtype=np.uint8)
+        # Periodic (stroke_count, snapshot) checkpoints so undo only has to
+        # re-rasterize the strokes drawn since the last checkpoint.
+        self._checkpoints: List[Tuple[int, np.ndarray]] = []
+
+        # Reusable scratch buffer for compositing the in-progress stroke,
+        # so get_canvas never allocates a fresh full-frame copy per frame.
+        self._scratch = np.empty_like(self.canvas)
+        self._scratch_valid = False
+        self._scratch_dirty_box: Optional[Tuple[int, int, int, int]] = None
+
         self.current_stroke: Optional[Stroke] = None
         self.current_color = COLORS['White']
         self.current_size = BRUSH_SIZES[DEFAULT_BRUSH_SIZE]
         self.is_drawing = False
-    
+
+        # Smooths the noisy camera-derived point stream before recording,
+        # which also reduces the number of segments each stroke rasterizes
+        self._point_filter = OneEuroFilter() if DRAWING_SMOOTHING else None
+
     def start_stroke(self):
         """Start a new stroke."""
         if not self.is_drawing:
             self.current_stroke = Stroke(self.current_color, self.current_size)
             self.is_drawing = True
-    
+            if self._point_filter is not None:
+                self._point_filter.reset()
+
     def add_point(self, x: int, y: int):
         """
         Add a point to the current stroke.
-        
+
         Args:
             x: X coordinate
             y: Y coordinate
         """
-        if self.is_drawing and self.current_stroke:
+        # Explicit None check: an empty stroke is falsy now that Stroke
+        # defines __len__, but it is exactly the one we want to fill here
+        if self.is_drawing and self.current_stroke is not None:
+            if self._point_filter is not None:
+                x, y = self._point_filter.push(x, y)
             # Clamp coordinates to canvas bounds
             x = max(0, min(x, self.width - 1))
             y = max(0, min(y, self.height - 1))
+            # Skip duplicate consecutive points - they only add 0-length segments
+            if self.current_stroke.last_point == (x, y):
+                return
             self.current_stroke.add_point(x, y)
     
     def end_stroke(self):
         """End the current stroke and add it to history."""
-        if self.is_drawing and self.current_stroke:
-            if len(self.current_stroke.points) > 0:
+        if self.is_drawing and self.current_stroke is not None:
+            if len(self.current_stroke) > 0:
                 self.strokes.append(self.current_stroke)
                 # Clear redo stack when new stroke is added
                 self.undo_stack.clear()
-                
+
+                # Bake the finished stroke onto the committed canvas once
+                self.current_stroke.draw(self.canvas)
+                self._scratch_valid = False
+                self._maybe_checkpoint()
+
                 # Limit stroke history
                 if len(self.strokes) > MAX_UNDO_STACK_SIZE:
-                    self.strokes.pop(0)
-            
+                    self._evict_oldest_stroke()
+
             self.current_stroke = None
             self.is_drawing = False
-    
+
     def undo(self):
         """Undo the last stroke."""
         if self.strokes:
             stroke = self.strokes.pop()
             self.undo_stack.append(stroke)
-            self._redraw()
-    
+            self._rebuild_from_checkpoint()
+            self._scratch_valid = False
+
     def redo(self):
         """Redo the last undone stroke."""
         if self.undo_stack:
             stroke = self.undo_stack.pop()
             self.strokes.append(stroke)
-            self._redraw()
-    
+            # Redo only has to rasterize the single restored stroke
+            stroke.draw(self.canvas)
+            self._scratch_valid = False
+            self._maybe_checkpoint()
+
     def clear(self):
         """Clear the entire canvas."""
         self.strokes.clear()
         self.undo_stack.clear()
+        self._checkpoints.clear()
         self.current_stroke = None
         self.is_drawing = False
-        self._redraw()
+        self._base_canvas[:] = self.bg_color
+        self.canvas[:] = self.bg_color
+        self._scratch_valid = False
     
     def set_color(self, color: Tuple[int, int, int]):
         """
@@ -154,46 +223,88 @@ class Canvas:
     
     def cycle_color(self):
         """Cycle to the next color in the palette."""
-        color_list = list(COLORS.values())
         try:
-            current_index = color_list.index(self.current_color)
-            next_index = (current_index + 1) % len(color_list)
-            self.current_color = color_list[next_index]
+            current_index = COLOR_LIST.index(self.current_color)
+            next_index = (current_index + 1) % len(COLOR_LIST)
+            self.current_color = COLOR_LIST[next_index]
         except ValueError:
-            self.current_color = color_list[0]
+            self.current_color = COLOR_LIST[0]
     
     def get_canvas(self) -> np.ndarray:
         """
         Get the current canvas with all strokes drawn.
-        
+
         Returns:
             Canvas image
         """
         # Draw current stroke if in progress
-        if self.is_drawing and self.current_stroke and len(self.current_stroke.points) > 0:
-            temp_canvas = self.canvas.copy()
-            self.current_stroke.draw(temp_canvas)
-            return temp_canvas
-        
+        if self.is_drawing and self.current_stroke and len(self.current_stroke) > 0:
+            if not self._scratch_valid:
+                # Committed canvas changed since last frame - resync fully
+                np.copyto(self._scratch, self.canvas)
+                self._scratch_valid = True
+            elif self._scratch_dirty_box is not None:
+                # Only re-copy the region the previous frame's overlay touched
+                x0, y0, x1, y1 = self._scratch_dirty_box
+                np.copyto(self._scratch[y0:y1, x0:x1], self.canvas[y0:y1, x0:x1])
+
+            self.current_stroke.draw(self._scratch)
+            self._scratch_dirty_box = self._stroke_bounding_box(self.current_stroke)
+            return self._scratch
+
         return self.canvas
+
+    def _stroke_bounding_box(self, stroke: Stroke) -> Tuple[int, int, int, int]:
+        """Bounding box of a stroke padded by its pen width, clipped to the canvas."""
+        pts = stroke.points
+        margin = stroke.size * LINE_THICKNESS_MULTIPLIER + 2
+        x0 = max(0, int(pts[:, 0].min()) - margin)
+        y0 = max(0, int(pts[:, 1].min()) - margin)
+        x1 = min(self.width, int(pts[:, 0].max()) + margin)
+        y1 = min(self.height, int(pts[:, 1].max()) + margin)
+        return x0, y0, x1, y1
     
-    def _redraw(self):
-        """Redraw the entire canvas from scratch."""
-        # Clear canvas
-        self.canvas = np.full((self.height, self.width, 3), self.bg_color, dtype=np.uint8)
-        
-        # Redraw all strokes
-        for stroke in self.strokes:
+    def _maybe_checkpoint(self):
+        """Snapshot the committed canvas every CANVAS_CHECKPOINT_INTERVAL strokes."""
+        if len(self.strokes) % CANVAS_CHECKPOINT_INTERVAL == 0:
+            self._checkpoints.append((len(self.strokes), self.canvas.copy()))
+
+    def _evict_oldest_stroke(self):
+        """Drop the oldest stroke from the undo history, baking it permanently."""
+        evicted = self.strokes.popleft()
+        evicted.draw(self._base_canvas)
+        # Checkpoint stroke counts shift down by one; a snapshot that now
+        # covers zero strokes equals the base canvas and is dropped.
+        self._checkpoints = [(count - 1, snapshot)
+                             for count, snapshot in self._checkpoints
+                             if count - 1 > 0]
+
+    def _rebuild_from_checkpoint(self):
+        """Rebuild the committed canvas after undo.
+
+        Restores the most recent checkpoint that is still valid and only
+        re-rasterizes the strokes drawn after it, instead of redrawing the
+        whole history from scratch.
+        """
+        # Discard checkpoints taken after the current stroke count
+        while self._checkpoints and self._checkpoints[-1][0] > len(self.strokes):
+            self._checkpoints.pop()
+
+        if self._checkpoints:
+            start, snapshot = self._checkpoints[-1]
+            np.copyto(self.canvas, snapshot)
+        else:
+            start = 0
+            np.copyto(self.canvas, self._base_canvas)
+
+        for stroke in islice(self.strokes, start, None):
             stroke.draw(self.canvas)
     
     def get_current_color_name(self) -> str:
         """
         Get the name of the current color.
-        
+
         Returns:
             Color name
         """
-        for name, color in COLORS.items():
-            if color == self.current_color:
-                return name
-        return "Unknown"
+        return COLOR_NAMES.get(self.current_color, "Unknown")
@@ -28,6 +28,10 @@ COLORS = {
     'Eraser': (40, 40, 40)  # Dark gray (matches canvas background)
 }
 
+# Derived lookups so per-frame code never rescans COLORS
+COLOR_NAMES = {color: name for name, color in COLORS.items()}
+COLOR_LIST = list(COLORS.values())
+
 # UI Colors
 CANVAS_BG_COLOR = (40, 40, 40)  # Dark gray background
 TOOLBAR_BG_COLOR = (60, 60, 60)
@@ -58,9 +62,28 @@ GESTURE_BAR_PADDING = 15
 GESTURE_HIGHLIGHT_MARGIN = 10  # Margin for gesture highlight rectangle
 
 # Hand tracking configuration
+# Tasks-API model bundle; when the resolved file exists (and mediapipe 0.10+
+# is installed) the tracker uses the HandLandmarker task with the GPU
+# delegate, falling back to CPU, instead of the legacy solutions API.
+# Quantized variants ("int8", "fp16") cut weight and activation bandwidth,
+# which is what CPU inference of this small CNN is bound by; drop the
+# corresponding hand_landmarker_<variant>.task bundle next to this file.
+HAND_MODEL_VARIANT = "fp32"  # "fp32" | "fp16" | "int8"
+HAND_MODEL_PATH = ("hand_landmarker.task" if HAND_MODEL_VARIANT == "fp32"
+                   else f"hand_landmarker_{HAND_MODEL_VARIANT}.task")
 MEDIAPIPE_DETECTION_CONFIDENCE = 0.7
 MEDIAPIPE_TRACKING_CONFIDENCE = 0.7
+MEDIAPIPE_MODEL_COMPLEXITY = 0  # 0 = lite model (~2x faster), 1 = full model
 MAX_NUM_HANDS = 1
+HAND_TRACKING_SCALE = 0.5  # Downscale factor for frames fed to hand detection (1.0 = full res)
+ASYNC_INFERENCE = True  # Run hand detection in a worker thread so it never blocks the display loop
+MOTION_GATING = True  # Skip hand detection entirely while the camera image is static
+MOTION_GATE_SIZE = (64, 36)  # Resolution of the cheap frame-difference gate image
+MOTION_THRESHOLD = 30000  # L1 diff on the gate image below which a frame counts as static
+MOTION_RESULT_MAX_AGE = 0.2  # Seconds a cached detection result may be reused while static
+SHOW_LANDMARKS = True  # Draw the hand skeleton on the camera preview
+# Only draw landmarks while the user is not actively drawing
+LANDMARK_DRAW_GESTURES = ("Move", "Pause", "None")
 
 # Gesture detection thresholds
 FINGER_TIP_THRESHOLD = 0.1  # Distance threshold for finger being "up"
@@ -75,10 +98,11 @@ ANTI_ALIAS = True
 
 # Performance configuration
 TARGET_FPS = 30
-FRAME_SKIP = 0  # Number of frames to skip for processing (0 = no skip)
+FRAME_SKIP = 1  # Frames to skip between hand detections (cursor is extrapolated in between)
 
 # Undo/Redo configuration
 MAX_UNDO_STACK_SIZE = 50
+CANVAS_CHECKPOINT_INTERVAL = 8  # Snapshot the canvas every N strokes to speed up undo
 
 # Gesture cooldown (in frames) to prevent rapid toggling
 GESTURE_COOLDOWN = 10
@@ -31,19 +31,22 @@ gesture_guide = GestureGuide(CANVAS_WIDTH, CANVAS_HEIGHT)
 # Mouse state
 is_drawing = False
 last_point = None
+# Redraw flag - the loop only rebuilds the display after something changed
+dirty = True
 
 def mouse_callback(event, x, y, flags, param):
     """Handle mouse events for drawing."""
-    global is_drawing, last_point
-    
+    global is_drawing, last_point, dirty
+
     if event == cv2.EVENT_LBUTTONDOWN:
         # Check if clicked on toolbar
         if y < TOOLBAR_HEIGHT:
             color = toolbar.get_color_at_position(x, y)
             if color is not None:
                 canvas.set_color(color)
+                dirty = True
                 return
-            
+
             button = toolbar.get_button_at_position(x, y)
             if button == 'Undo':
                 canvas.undo()
@@ -51,24 +54,29 @@ def mouse_callback(event, x, y, flags, param):
                 canvas.redo()
             elif button == 'Clear':
                 canvas.clear()
+            if button is not None:
+                dirty = True
             return
-        
+
         # Start drawing
         is_drawing = True
         canvas.start_stroke()
         canvas.add_point(x, y)
         last_point = (x, y)
-    
+        dirty = True
+
     elif event == cv2.EVENT_MOUSEMOVE:
         if is_drawing:
             canvas.add_point(x, y)
             last_point = (x, y)
-    
+            dirty = True
+
     elif event == cv2.EVENT_LBUTTONUP:
         if is_drawing:
             canvas.end_stroke()
             is_drawing = False
             last_point = None
+            dirty = True
 
 # Create window
 cv2.namedWindow(WINDOW_NAME)
@@ -77,35 +85,44 @@ cv2.setMouseCallback(WINDOW_NAME, mouse_callback)
 # Main loop
 print("Demo running... Draw with your mouse!")
 
+display = None
+
 while True:
-    # Get canvas
-    display = canvas.get_canvas()
-    
-    # Draw toolbar
-    display = toolbar.draw(display, canvas.current_color, canvas.current_size)
-    
-    # Draw gesture guide
-    gesture_guide.update_active_gesture("Demo Mode")
-    display = gesture_guide.draw(display)
-    
-    # Draw instructions
-    cv2.putText(display, "DEMO MODE - Use mouse to draw", 
-               (10, CANVAS_HEIGHT - GESTURE_BAR_HEIGHT - 10),
-               cv2.FONT_HERSHEY_SIMPLEX, 0.6, TEXT_COLOR, 1, cv2.LINE_AA)
-    
+    # Rebuild the display only when something changed since the last frame
+    if dirty or display is None:
+        display = canvas.get_canvas().copy()
+
+        # Draw toolbar
+        display = toolbar.draw(display, canvas.current_color, canvas.current_size)
+
+        # Draw gesture guide
+        gesture_guide.update_active_gesture("Demo Mode")
+        display = gesture_guide.draw(display)
+
+        # Draw instructions
+        cv2.putText(display, "DEMO MODE - Use mouse to draw",
+                   (10, CANVAS_HEIGHT - GESTURE_BAR_HEIGHT - 10),
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, TEXT_COLOR, 1, cv2.LINE_AA)
+
+        dirty = False
+
     # Show display
     cv2.imshow(WINDOW_NAME, display)
-    
-    # Handle keyboard
-    key = cv2.waitKey(1) & 0xFF
+
+    # The 33 ms wait caps the loop at ~30 FPS and keeps CPU near zero
+    # while the demo sits idle
+    key = cv2.waitKey(33) & 0xFF
     if key == ord('q') or key == 27:  # Q or ESC
         break
     elif key == ord('c'):  # Clear
         canvas.clear()
+        dirty = True
     elif key == ord('u'):  # Undo
         canvas.undo()
+        dirty = True
     elif key == ord('r'):  # Redo
         canvas.redo()
+        dirty = True
 
 cv2.destroyAllWindows()
 print("\nDemo closed. Thank you!")
@@ -0,0 +1,107 @@
+"""
+Point smoothing filters for Air Canvas.
+Smooths the noisy camera-derived fingertip stream before points are recorded,
+which cuts the number of drawn segments and visibly steadies strokes.
+"""
+
+import math
+from typing import Tuple
+
+from config import TARGET_FPS
+
+# Numba is optional - when available the per-point filter step is JIT-compiled,
+# otherwise the pure-Python implementation is used as-is
+NUMBA_AVAILABLE = False
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except Exception:
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed."""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap
+
+
+@njit(cache=True)
+def _one_euro_step(x: float, x_prev: float, dx_prev: float, dt: float,
+                   min_cutoff: float, beta: float, d_cutoff: float) -> Tuple[float, float]:
+    """One step of the one-euro filter for a single axis.
+
+    Returns the filtered value and the filtered derivative, which the caller
+    carries as state into the next step.
+    """
+    # Smooth the derivative first
+    dx = (x - x_prev) / dt
+    r_d = 2.0 * math.pi * d_cutoff * dt
+    a_d = r_d / (r_d + 1.0)
+    dx_hat = a_d * dx + (1.0 - a_d) * dx_prev
+
+    # Velocity-adaptive cutoff: low jitter at rest, low lag in fast motion
+    cutoff = min_cutoff + beta * abs(dx_hat)
+    r = 2.0 * math.pi * cutoff * dt
+    a = r / (r + 1.0)
+    x_hat = a * x + (1.0 - a) * x_prev
+
+    return x_hat, dx_hat
+
+
+class OneEuroFilter:
+    """One-euro filter for a stream of 2D points."""
+
+    def __init__(self, freq: float = float(TARGET_FPS), min_cutoff: float = 1.0,
+                 beta: float = 0.007, d_cutoff: float = 1.0):
+        """
+        Initialize the filter.
+
+        Args:
+            freq: Expected sample rate in Hz
+            min_cutoff: Minimum cutoff frequency (lower = smoother at rest)
+            beta: Speed coefficient (higher = less lag during fast motion)
+            d_cutoff: Cutoff frequency for the derivative filter
+        """
+        self.dt = 1.0 / freq
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self._x = 0.0
+        self._y = 0.0
+        self._dx = 0.0
+        self._dy = 0.0
+        self._initialized = False
+
+    def push(self, x: float, y: float) -> Tuple[int, int]:
+        """
+        Filter one point and return the smoothed coordinates.
+
+        Args:
+            x: Raw x coordinate
+            y: Raw y coordinate
+
+        Returns:
+            Smoothed (x, y) as integers
+        """
+        if not self._initialized:
+            self._x, self._y = float(x), float(y)
+            self._initialized = True
+            return int(x), int(y)
+
+        self._x, self._dx = _one_euro_step(float(x), self._x, self._dx, self.dt,
+                                           self.min_cutoff, self.beta, self.d_cutoff)
+        self._y, self._dy = _one_euro_step(float(y), self._y, self._dy, self.dt,
+                                           self.min_cutoff, self.beta, self.d_cutoff)
+        return int(round(self._x)), int(round(self._y))
+
+    def reset(self):
+        """Reset filter state for a new stroke."""
+        self._initialized = False
+        self._dx = 0.0
+        self._dy = 0.0
+
+
+# Warm up the JIT once at import so the first stroke does not pay compile cost
+if NUMBA_AVAILABLE:
+    _one_euro_step(0.0, 0.0, 0.0, 1.0 / 30.0, 1.0, 0.007, 1.0)
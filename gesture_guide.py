@@ -36,6 +36,23 @@ class GestureGuide:
         self.canvas_height = canvas_height
         self.bar_y = canvas_height - GESTURE_BAR_HEIGHT
         self.active_gesture = "None"
+
+        # The bar background pre-blended with the canvas background color,
+        # replacing the per-frame full-frame copy + addWeighted pass
+        blended_bg = tuple(int(0.8 * b + 0.2 * c)
+                           for b, c in zip(GESTURE_BAR_BG_COLOR, CANVAS_BG_COLOR))
+        self._bar_bg = np.full((GESTURE_BAR_HEIGHT, canvas_width, 3),
+                               blended_bg, dtype=np.uint8)
+        # Fully rendered bars cached per active gesture (at most one per gesture)
+        self._bar_cache: dict = {}
+
+        # Layout is fixed, so precompute per-gesture x-centers and label sizes
+        # instead of recomputing them on every bar render
+        self._gesture_width = (canvas_width - 2 * GESTURE_BAR_PADDING) // len(self.GESTURES)
+        self._x_centers = [GESTURE_BAR_PADDING + i * self._gesture_width + self._gesture_width // 2
+                           for i in range(len(self.GESTURES))]
+        self._label_sizes = [cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)[0]
+                             for _, _, label in self.GESTURES]
     
     def update_active_gesture(self, gesture: str):
         """
@@ -49,57 +66,58 @@ class GestureGuide:
     def draw(self, frame: np.ndarray) -> np.ndarray:
         """
         Draw the gesture guide bar on the frame.
-        
+
         Args:
             frame: Frame to draw on
-        
+
         Returns:
             Frame with gesture guide drawn
         """
-        # Draw background bar
-        bar_overlay = frame.copy()
-        cv2.rectangle(bar_overlay, 
-                     (0, self.bar_y), 
-                     (self.canvas_width, self.canvas_height),
-                     GESTURE_BAR_BG_COLOR, -1)
-        cv2.addWeighted(bar_overlay, 0.8, frame, 0.2, 0, frame)
-        
-        # Calculate spacing for gestures
-        num_gestures = len(self.GESTURES)
-        gesture_width = (self.canvas_width - 2 * GESTURE_BAR_PADDING) // num_gestures
-        
+        bar = self._bar_cache.get(self.active_gesture)
+        if bar is None:
+            bar = self._render_bar(self.active_gesture)
+            self._bar_cache[self.active_gesture] = bar
+
+        # Single memcpy of the cached strip instead of re-rendering the bar
+        np.copyto(frame[self.bar_y:self.canvas_height], bar)
+        return frame
+
+    def _render_bar(self, active_gesture: str) -> np.ndarray:
+        """Render the full gesture bar for one active gesture (cached by draw)."""
+        bar = self._bar_bg.copy()
+
+        gesture_width = self._gesture_width
+
         # Draw each gesture
         for i, (gesture_name, emoji, label) in enumerate(self.GESTURES):
-            x_center = GESTURE_BAR_PADDING + i * gesture_width + gesture_width // 2
-            y_center = self.bar_y + GESTURE_BAR_HEIGHT // 2
-            
+            x_center = self._x_centers[i]
+            y_center = GESTURE_BAR_HEIGHT // 2
+
             # Highlight active gesture
-            is_active = (gesture_name == self.active_gesture)
-            
+            is_active = (gesture_name == active_gesture)
+
             if is_active:
                 # Draw highlight rectangle
                 draw_rounded_rectangle(
-                    frame,
-                    (x_center - gesture_width // 2 + GESTURE_HIGHLIGHT_MARGIN, self.bar_y + GESTURE_HIGHLIGHT_MARGIN),
-                    (x_center + gesture_width // 2 - GESTURE_HIGHLIGHT_MARGIN, self.canvas_height - GESTURE_HIGHLIGHT_MARGIN),
+                    bar,
+                    (x_center - gesture_width // 2 + GESTURE_HIGHLIGHT_MARGIN, GESTURE_HIGHLIGHT_MARGIN),
+                    (x_center + gesture_width // 2 - GESTURE_HIGHLIGHT_MARGIN, GESTURE_BAR_HEIGHT - GESTURE_HIGHLIGHT_MARGIN),
                     ACTIVE_GESTURE_COLOR,
                     2,
                     radius=8
                 )
-            
+
             # Draw emoji/icon (using text as fallback since emojis may not render well)
             icon_color = ACTIVE_GESTURE_COLOR if is_active else TEXT_COLOR
-            cv2.putText(frame, emoji, 
+            cv2.putText(bar, emoji,
                        (x_center - 15, y_center - 10),
                        cv2.FONT_HERSHEY_SIMPLEX, 1.2, icon_color, 2, cv2.LINE_AA)
-            
+
             # Draw label
             label_color = ACTIVE_GESTURE_COLOR if is_active else TEXT_COLOR
-            (text_width, text_height), _ = cv2.getTextSize(
-                label, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1
-            )
-            cv2.putText(frame, label,
+            text_width, text_height = self._label_sizes[i]
+            cv2.putText(bar, label,
                        (x_center - text_width // 2, y_center + 25),
                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, label_color, 1, cv2.LINE_AA)
-        
-        return frame
+
+        return bar
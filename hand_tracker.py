@@ -7,21 +7,42 @@ there may be compatibility issues. See README.md for installation instructions.
 
 import cv2
 import numpy as np
+import os
+import queue
+import threading
+import time
+from collections import Counter, deque
 from typing import Optional, Tuple, List, Dict
 from config import *
+from filters import njit, NUMBA_AVAILABLE
+
+__all__ = ["HandTracker"]
 
 # Try to import hand tracking libraries
 HAND_TRACKING_AVAILABLE = False
 HAND_TRACKING_METHOD = "none"
 
-# Try cvzone first (simpler API)
+# Prefer the Tasks API (mediapipe 0.10+): its HandLandmarker supports the
+# GPU delegate. Only activates when the model bundle is actually on disk.
 try:
-    from cvzone.HandTrackingModule import HandDetector as CVZoneHandDetector
-    HAND_TRACKING_AVAILABLE = True
-    HAND_TRACKING_METHOD = "cvzone"
+    import mediapipe as mp
+    from mediapipe.tasks import python as mp_tasks
+    from mediapipe.tasks.python import vision as mp_vision
+    if os.path.exists(HAND_MODEL_PATH):
+        HAND_TRACKING_AVAILABLE = True
+        HAND_TRACKING_METHOD = "mediapipe_tasks"
 except Exception as e:
     pass
 
+# Try cvzone next (simpler API)
+if not HAND_TRACKING_AVAILABLE:
+    try:
+        from cvzone.HandTrackingModule import HandDetector as CVZoneHandDetector
+        HAND_TRACKING_AVAILABLE = True
+        HAND_TRACKING_METHOD = "cvzone"
+    except Exception as e:
+        pass
+
 # If cvzone fails, try direct mediapipe
 if not HAND_TRACKING_AVAILABLE:
     try:
@@ -36,6 +57,97 @@ if not HAND_TRACKING_AVAILABLE:
         pass
 
 
+# Gestures keyed by the finger state packed into a 5-bit code
+# (thumb<<4 | index<<3 | middle<<2 | ring<<1 | pinky)
+_GESTURE_MAP = {
+    0b01000: "Draw",         # Index up
+    0b01100: "Move",         # Index + middle up
+    0b01110: "ChangeColor",  # Index + middle + ring up
+    0b10000: "Undo",         # Thumb up
+    0b00001: "Redo",         # Pinky up
+    0b11111: "Clear",        # Open palm
+    0b00000: "Pause",        # Fist
+}
+
+
+@njit(cache=True)
+def _classify_fingers(lm: np.ndarray, tip_thresh: float, thumb_thresh: float) -> int:
+    """Classify finger state straight from the (21, 2) landmark array.
+
+    Returns the packed 5-bit finger code for _GESTURE_MAP. JIT-compiled when
+    Numba is installed; the same code runs as plain Python otherwise.
+    """
+    thumb = 1 if lm[4, 0] < lm[3, 0] - thumb_thresh else 0
+    index = 1 if lm[8, 1] < lm[6, 1] - tip_thresh else 0
+    middle = 1 if lm[12, 1] < lm[10, 1] - tip_thresh else 0
+    ring = 1 if lm[16, 1] < lm[14, 1] - tip_thresh else 0
+    pinky = 1 if lm[20, 1] < lm[18, 1] - tip_thresh else 0
+    return (thumb << 4) | (index << 3) | (middle << 2) | (ring << 1) | pinky
+
+
+# Warm up the JIT once at import so the first frame does not pay compile cost
+if NUMBA_AVAILABLE:
+    _classify_fingers(np.zeros((21, 2), dtype=np.float32), 0.1, 0.05)
+
+
+# One detection graph per process: every HandTracker instance shares it, so
+# creating a second tracker never loads the TFLite palm/landmark models (or a
+# second cvzone detector) into memory again.
+_shared_detector = None
+
+
+def _create_tasks_landmarker():
+    """Build a Tasks-API HandLandmarker, preferring the GPU delegate."""
+    last_error = None
+    for delegate in (mp_tasks.BaseOptions.Delegate.GPU,
+                     mp_tasks.BaseOptions.Delegate.CPU):
+        try:
+            options = mp_vision.HandLandmarkerOptions(
+                base_options=mp_tasks.BaseOptions(
+                    model_asset_path=HAND_MODEL_PATH, delegate=delegate),
+                running_mode=mp_vision.RunningMode.VIDEO,
+                num_hands=MAX_NUM_HANDS,
+                min_hand_detection_confidence=MEDIAPIPE_DETECTION_CONFIDENCE,
+                min_tracking_confidence=MEDIAPIPE_TRACKING_CONFIDENCE
+            )
+            landmarker = mp_vision.HandLandmarker.create_from_options(options)
+            print(f"✓ HandLandmarker delegate: {delegate.name}")
+            return landmarker
+        except Exception as e:
+            # No usable GPU (or broken GL context) - fall back to CPU
+            last_error = e
+    raise RuntimeError(f"HandLandmarker initialization failed: {last_error}")
+
+
+def _get_shared_detector():
+    """Lazily build the backend detector, reusing it across instances."""
+    global _shared_detector
+    if _shared_detector is None:
+        if HAND_TRACKING_METHOD == "mediapipe_tasks":
+            _shared_detector = _create_tasks_landmarker()
+        elif HAND_TRACKING_METHOD == "cvzone":
+            _shared_detector = CVZoneHandDetector(
+                maxHands=MAX_NUM_HANDS,
+                detectionCon=MEDIAPIPE_DETECTION_CONFIDENCE,
+                minTrackCon=MEDIAPIPE_TRACKING_CONFIDENCE
+            )
+        elif HAND_TRACKING_METHOD == "mediapipe_legacy":
+            _shared_detector = mp_hands.Hands(
+                static_image_mode=False,
+                max_num_hands=MAX_NUM_HANDS,
+                model_complexity=MEDIAPIPE_MODEL_COMPLEXITY,
+                min_detection_confidence=MEDIAPIPE_DETECTION_CONFIDENCE,
+                min_tracking_confidence=MEDIAPIPE_TRACKING_CONFIDENCE
+            )
+    return _shared_detector
+
+
+def _drop_shared_detector():
+    """Forget the shared detector after its graph has been closed."""
+    global _shared_detector
+    _shared_detector = None
+
+
 class HandTracker:
     """Hand tracking and gesture recognition."""
     
@@ -53,12 +165,56 @@ class HandTracker:
     PINKY_PIP = 18
     
     WRIST = 0
-    
+
+    # Landmark index pairs forming the hand skeleton (mirrors
+    # mp.solutions.hands.HAND_CONNECTIONS), used to draw cached cvzone
+    # landmarks without re-running detection
+    HAND_CONNECTIONS = (
+        (0, 1), (1, 2), (2, 3), (3, 4),        # Thumb
+        (0, 5), (5, 6), (6, 7), (7, 8),        # Index
+        (5, 9), (9, 10), (10, 11), (11, 12),   # Middle
+        (9, 13), (13, 14), (14, 15), (15, 16), # Ring
+        (13, 17), (17, 18), (18, 19), (19, 20),# Pinky
+        (0, 17)                                # Palm
+    )
+
+    # Index arrays for vectorized finger up/down tests
+    _FINGER_TIPS = np.array([INDEX_TIP, MIDDLE_TIP, RING_TIP, PINKY_TIP])
+    _FINGER_PIPS = np.array([INDEX_PIP, MIDDLE_PIP, RING_PIP, PINKY_PIP])
+
     def __init__(self):
         """Initialize hand tracking."""
         self.current_gesture = "None"
-        self.gesture_history = []
+        # Sliding gesture window plus a running tally, so the smoothing mode
+        # is O(1) per frame instead of rescanning the history
+        self.gesture_history = deque(maxlen=GESTURE_SMOOTHING_FRAMES)
+        self._gesture_counts = Counter()
         self.gesture_cooldown_counter = 0
+        # Reusable BGR->RGB conversion buffer, sized lazily on the first frame
+        self._rgb: Optional[np.ndarray] = None
+        # Reusable (21, 2) landmark array filled once per frame; gestures
+        # only need x/y, so the z coordinate is never extracted
+        self._lm = np.empty((21, 2), dtype=np.float32)
+        # Last pixel-space landmark array and the shape of the frame it came
+        # from, so draw_landmarks can render without a second detection pass
+        self._last_lmlist: Optional[np.ndarray] = None
+        self._last_frame_shape: Optional[Tuple[int, int]] = None
+
+        # Async inference state: the worker thread owns the detector and all
+        # gesture-smoothing state; process_frame just publishes frames and
+        # reads the latest published result
+        self._in_queue: "queue.Queue[Optional[np.ndarray]]" = queue.Queue(maxsize=1)
+        self._latest_result: Tuple[Optional[list], Dict] = (None, {
+            'gesture': 'None', 'position': None,
+            'hand_landmarks': None, 'confidence': 0.0
+        })
+        self._worker_thread: Optional[threading.Thread] = None
+        self._latest_result_ts = 0.0
+
+        # Motion-gate state: tiny current/previous frames compared per frame
+        # to skip detection entirely while the camera image is static
+        self._gate_cur: Optional[np.ndarray] = None
+        self._gate_prev: Optional[np.ndarray] = None
         
         if not HAND_TRACKING_AVAILABLE:
             print("\n" + "=" * 70)
@@ -79,30 +235,35 @@ class HandTracker:
             return
         
         # Initialize based on available method
-        if HAND_TRACKING_METHOD == "cvzone":
+        if HAND_TRACKING_METHOD == "mediapipe_tasks":
+            try:
+                self.detector = _get_shared_detector()
+                self.method = "mediapipe_tasks"
+                print(f"✓ Hand tracking initialized using MediaPipe Tasks API")
+            except Exception as e:
+                print(f"Warning: MediaPipe Tasks initialization failed: {e}")
+                self.detector = None
+                self.method = "mock"
+
+        elif HAND_TRACKING_METHOD == "cvzone":
             try:
-                self.detector = CVZoneHandDetector(
-                    maxHands=MAX_NUM_HANDS,
-                    detectionCon=MEDIAPIPE_DETECTION_CONFIDENCE,
-                    minTrackCon=MEDIAPIPE_TRACKING_CONFIDENCE
-                )
+                self.detector = _get_shared_detector()
                 self.method = "cvzone"
                 print(f"✓ Hand tracking initialized using cvzone")
             except Exception as e:
                 print(f"Warning: cvzone initialization failed: {e}")
                 self.detector = None
                 self.method = "mock"
-        
+
         elif HAND_TRACKING_METHOD == "mediapipe_legacy":
             try:
-                self.detector = mp_hands.Hands(
-                    static_image_mode=False,
-                    max_num_hands=MAX_NUM_HANDS,
-                    min_detection_confidence=MEDIAPIPE_DETECTION_CONFIDENCE,
-                    min_tracking_confidence=MEDIAPIPE_TRACKING_CONFIDENCE
-                )
+                self.detector = _get_shared_detector()
                 self.mp_hands = mp_hands
                 self.mp_draw = mp_draw
+                # Reused drawing styles so draw_landmarks does not allocate
+                # DrawingSpec objects on every call
+                self._landmark_spec = mp_draw.DrawingSpec(color=(0, 255, 0), thickness=2, circle_radius=2)
+                self._connection_spec = mp_draw.DrawingSpec(color=(0, 255, 255), thickness=2)
                 self.method = "mediapipe_legacy"
                 print(f"✓ Hand tracking initialized using MediaPipe legacy API")
             except Exception as e:
@@ -112,36 +273,120 @@ class HandTracker:
         else:
             self.detector = None
             self.method = "mock"
-    
+
+        if ASYNC_INFERENCE and self.method != "mock":
+            self._worker_thread = threading.Thread(target=self._worker, daemon=True)
+            self._worker_thread.start()
+
     def process_frame(self, frame: np.ndarray) -> Tuple[Optional[list], Dict]:
         """
         Process a frame to detect hands and recognize gestures.
-        
+
+        With async inference enabled this never blocks: the frame is handed
+        to the worker thread (replacing any unprocessed one) and the most
+        recently completed result is returned immediately.
+
         Args:
             frame: Input frame (BGR)
-        
+
         Returns:
             Tuple of (hands list, gesture info dict)
         """
-        gesture_info = {
-            'gesture': 'None',
-            'position': None,
-            'hand_landmarks': None,
-            'confidence': 0.0
-        }
-        
         if self.method == "mock":
             # Mock mode - no actual hand tracking
-            return None, gesture_info
-        
-        elif self.method == "cvzone":
+            return None, {
+                'gesture': 'None',
+                'position': None,
+                'hand_landmarks': None,
+                'confidence': 0.0
+            }
+
+        # Downscale before detection: landmark tracking does not need full
+        # camera resolution, and both backends report positions relative to
+        # the frame they are given (cvzone) or normalized (MediaPipe), so the
+        # gesture mapping is unaffected. draw_landmarks rescales as needed.
+        if HAND_TRACKING_SCALE != 1.0:
+            frame = cv2.resize(frame, None,
+                               fx=HAND_TRACKING_SCALE, fy=HAND_TRACKING_SCALE,
+                               interpolation=cv2.INTER_AREA)
+
+        # Motion gate: when the tiny downsampled frame barely differs from
+        # the previous one, the landmark CNN would see an unchanged input -
+        # reuse the latest result instead of re-running it, as long as that
+        # result is fresh enough that a missed motion onset stays invisible
+        if MOTION_GATING and self._is_static(frame):
+            if time.monotonic() - self._latest_result_ts < MOTION_RESULT_MAX_AGE:
+                return self._latest_result
+
+        if self._worker_thread is not None:
+            # Drop-oldest put so the worker always sees the newest frame
+            try:
+                self._in_queue.put_nowait(frame)
+            except queue.Full:
+                try:
+                    self._in_queue.get_nowait()
+                except queue.Empty:
+                    pass
+                try:
+                    self._in_queue.put_nowait(frame)
+                except queue.Full:
+                    pass
+            return self._latest_result
+
+        result = self._process_sync(frame)
+        self._latest_result = result
+        self._latest_result_ts = time.monotonic()
+        return result
+
+    def _is_static(self, frame: np.ndarray) -> bool:
+        """Cheap frame-difference check on a tiny downsampled image."""
+        if self._gate_cur is None:
+            w, h = MOTION_GATE_SIZE
+            self._gate_cur = np.empty((h, w, 3), dtype=np.uint8)
+        cv2.resize(frame, MOTION_GATE_SIZE, dst=self._gate_cur,
+                   interpolation=cv2.INTER_AREA)
+        if self._gate_prev is None:
+            self._gate_prev = self._gate_cur.copy()
+            return False
+        diff = cv2.norm(self._gate_cur, self._gate_prev, cv2.NORM_L1)
+        # Swap buffers: the current gate image becomes the next comparison
+        # baseline without any allocation
+        self._gate_prev, self._gate_cur = self._gate_cur, self._gate_prev
+        return diff < MOTION_THRESHOLD
+
+    def _process_sync(self, frame: np.ndarray) -> Tuple[Optional[list], Dict]:
+        """Run one synchronous detection pass (called by the worker thread)."""
+        if self.method == "cvzone":
             return self._process_cvzone(frame)
-        
+
         elif self.method == "mediapipe_legacy":
             return self._process_mediapipe_legacy(frame)
-        
-        return None, gesture_info
-    
+
+        elif self.method == "mediapipe_tasks":
+            return self._process_mediapipe_tasks(frame)
+
+        return None, {
+            'gesture': 'None',
+            'position': None,
+            'hand_landmarks': None,
+            'confidence': 0.0
+        }
+
+    def _worker(self):
+        """Worker loop: consume frames and publish the latest result."""
+        while True:
+            frame = self._in_queue.get()
+            if frame is None:
+                break
+            # A transient per-frame failure must not kill the worker -
+            # otherwise process_frame would return the stale result forever
+            try:
+                self._latest_result = self._process_sync(frame)
+                self._latest_result_ts = time.monotonic()
+            except Exception as e:
+                print(f"Error in inference worker: {e}")
+
+
     def _process_cvzone(self, frame: np.ndarray) -> Tuple[Optional[list], Dict]:
         """Process frame using cvzone."""
         try:
@@ -156,15 +401,19 @@ class HandTracker:
             
             if hands:
                 hand = hands[0]
-                lmList = hand['lmList']
+                # Pack the list-of-lists landmark structure into one (21, 3)
+                # int32 array so downstream indexing and scaling are
+                # vectorized instead of walking nested Python lists
+                pts = np.asarray(hand['lmList'], dtype=np.int32)
+                self._last_lmlist = pts
+                self._last_frame_shape = frame.shape[:2]
                 fingers = self.detector.fingersUp(hand)
-                
+
                 gesture = self._recognize_gesture_from_fingers(fingers)
                 gesture = self._smooth_gesture(gesture)
-                
-                index_tip = lmList[self.INDEX_TIP]
-                position = (int(index_tip[0] * CANVAS_WIDTH / frame.shape[1]), 
-                           int(index_tip[1] * CANVAS_HEIGHT / frame.shape[0]))
+
+                position = (int(pts[self.INDEX_TIP, 0] * CANVAS_WIDTH / frame.shape[1]),
+                           int(pts[self.INDEX_TIP, 1] * CANVAS_HEIGHT / frame.shape[0]))
                 
                 gesture_info = {
                     'gesture': self.current_gesture,
@@ -172,7 +421,9 @@ class HandTracker:
                     'hand_landmarks': hands,
                     'confidence': 0.8
                 }
-            
+            else:
+                self._last_lmlist = None
+
             return hands, gesture_info
         except Exception as e:
             print(f"Error in cvzone processing: {e}")
@@ -181,8 +432,16 @@ class HandTracker:
     def _process_mediapipe_legacy(self, frame: np.ndarray) -> Tuple[Optional[list], Dict]:
         """Process frame using MediaPipe legacy API."""
         try:
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            results = self.detector.process(rgb_frame)
+            # Convert into a reused buffer instead of allocating per frame
+            if self._rgb is None or self._rgb.shape != frame.shape:
+                self._rgb = np.empty_like(frame)
+            # Toggle writability around the conversion: cvtColor needs a
+            # writable dst, while a read-only array lets MediaPipe reference
+            # the pixels instead of defensively copying them
+            self._rgb.flags.writeable = True
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb)
+            self._rgb.flags.writeable = False
+            results = self.detector.process(self._rgb)
             
             gesture_info = {
                 'gesture': 'None',
@@ -193,15 +452,17 @@ class HandTracker:
             
             if results.multi_hand_landmarks:
                 hand_landmarks = results.multi_hand_landmarks[0]
-                
-                # Extract landmarks
-                landmarks = []
-                for landmark in hand_landmarks.landmark:
-                    landmarks.append((landmark.x, landmark.y, landmark.z))
-                
-                # Recognize gesture
-                fingers = self._count_fingers_up(landmarks)
-                gesture = self._recognize_gesture_from_fingers(fingers)
+
+                # Extract landmarks into the reused array
+                lm = self._lm
+                for i, landmark in enumerate(hand_landmarks.landmark):
+                    lm[i, 0] = landmark.x
+                    lm[i, 1] = landmark.y
+
+                # Recognize gesture straight from the landmark array
+                code = _classify_fingers(lm, FINGER_TIP_THRESHOLD,
+                                         THUMB_DETECTION_THRESHOLD)
+                gesture = _GESTURE_MAP.get(code, "None")
                 gesture = self._smooth_gesture(gesture)
                 
                 # Get position
@@ -220,45 +481,87 @@ class HandTracker:
             print(f"Error in MediaPipe processing: {e}")
             return None, gesture_info
     
-    def _count_fingers_up(self, landmarks: List[Tuple[float, float, float]]) -> List[int]:
-        """Determine which fingers are up (for MediaPipe legacy)."""
-        fingers = []
-        
-        # Thumb
-        if landmarks[self.THUMB_TIP][0] < landmarks[self.THUMB_IP][0] - THUMB_DETECTION_THRESHOLD:
-            fingers.append(1)
-        else:
-            fingers.append(0)
-        
-        # Other fingers
-        finger_tips = [self.INDEX_TIP, self.MIDDLE_TIP, self.RING_TIP, self.PINKY_TIP]
-        finger_pips = [self.INDEX_PIP, self.MIDDLE_PIP, self.RING_PIP, self.PINKY_PIP]
-        
-        for tip, pip in zip(finger_tips, finger_pips):
-            if landmarks[tip][1] < landmarks[pip][1] - FINGER_TIP_THRESHOLD:
-                fingers.append(1)
+    def _process_mediapipe_tasks(self, frame: np.ndarray) -> Tuple[Optional[list], Dict]:
+        """Process frame using the Tasks API HandLandmarker."""
+        # Initialized before the try so the except clause always has a
+        # well-defined result to return
+        gesture_info = {
+            'gesture': 'None',
+            'position': None,
+            'hand_landmarks': None,
+            'confidence': 0.0
+        }
+        try:
+            # Convert into a reused buffer instead of allocating per frame
+            if self._rgb is None or self._rgb.shape != frame.shape:
+                self._rgb = np.empty_like(frame)
+            # Same writability toggle as the legacy path: a read-only array
+            # allows mp.Image to wrap the buffer without copying
+            self._rgb.flags.writeable = True
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb)
+            self._rgb.flags.writeable = False
+            image = mp.Image(image_format=mp.ImageFormat.SRGB, data=self._rgb)
+            # VIDEO mode only needs monotonically increasing timestamps
+            result = self.detector.detect_for_video(
+                image, int(time.monotonic() * 1000))
+
+            if result.hand_landmarks:
+                hand = result.hand_landmarks[0]
+
+                # Extract landmarks into the reused array
+                lm = self._lm
+                for i, landmark in enumerate(hand):
+                    lm[i, 0] = landmark.x
+                    lm[i, 1] = landmark.y
+
+                # Cache pixel-space landmarks for the manual skeleton renderer
+                h, w = frame.shape[:2]
+                self._last_lmlist = (lm * (w, h)).astype(np.int32)
+                self._last_frame_shape = frame.shape[:2]
+
+                code = _classify_fingers(lm, FINGER_TIP_THRESHOLD,
+                                         THUMB_DETECTION_THRESHOLD)
+                gesture = _GESTURE_MAP.get(code, "None")
+                gesture = self._smooth_gesture(gesture)
+
+                index_tip = hand[self.INDEX_TIP]
+                position = (int(index_tip.x * CANVAS_WIDTH), int(index_tip.y * CANVAS_HEIGHT))
+
+                gesture_info = {
+                    'gesture': self.current_gesture,
+                    'position': position,
+                    'hand_landmarks': result.hand_landmarks,
+                    'confidence': 0.8
+                }
             else:
-                fingers.append(0)
-        
-        return fingers
+                self._last_lmlist = None
+
+            return result.hand_landmarks if result.hand_landmarks else None, gesture_info
+        except Exception as e:
+            print(f"Error in MediaPipe Tasks processing: {e}")
+            return None, gesture_info
+
+    def _count_fingers_up(self, landmarks: np.ndarray) -> List[int]:
+        """Determine which fingers are up (for MediaPipe legacy).
+
+        Args:
+            landmarks: (21, 2) array of normalized landmark coordinates
+
+        Returns:
+            [thumb, index, middle, ring, pinky] as 0/1 flags
+        """
+        # Thumb extends laterally; the other four are one vectorized compare
+        thumb = int(landmarks[self.THUMB_TIP, 0] <
+                    landmarks[self.THUMB_IP, 0] - THUMB_DETECTION_THRESHOLD)
+        up = (landmarks[self._FINGER_TIPS, 1] <
+              landmarks[self._FINGER_PIPS, 1] - FINGER_TIP_THRESHOLD)
+        return [thumb, *(int(f) for f in up)]
     
     def _recognize_gesture_from_fingers(self, fingers: List[int]) -> str:
         """Recognize gesture from fingers up list."""
-        if fingers == [0, 1, 0, 0, 0]:
-            return "Draw"
-        elif fingers == [0, 1, 1, 0, 0]:
-            return "Move"
-        elif fingers == [0, 1, 1, 1, 0]:
-            return "ChangeColor"
-        elif fingers == [1, 0, 0, 0, 0]:
-            return "Undo"
-        elif fingers == [0, 0, 0, 0, 1]:
-            return "Redo"
-        elif sum(fingers) == 5:
-            return "Clear"
-        elif sum(fingers) == 0:
-            return "Pause"
-        return "None"
+        code = ((fingers[0] << 4) | (fingers[1] << 3) | (fingers[2] << 2) |
+                (fingers[3] << 1) | fingers[4])
+        return _GESTURE_MAP.get(code, "None")
     
     def _smooth_gesture(self, gesture: str) -> str:
         """Apply gesture smoothing and cooldown."""
@@ -266,12 +569,17 @@ class HandTracker:
             self.gesture_cooldown_counter -= 1
             return self.current_gesture
         
+        # Update the sliding window and its running tally incrementally
+        if len(self.gesture_history) == GESTURE_SMOOTHING_FRAMES:
+            evicted = self.gesture_history[0]
+            self._gesture_counts[evicted] -= 1
+            if self._gesture_counts[evicted] <= 0:
+                del self._gesture_counts[evicted]
         self.gesture_history.append(gesture)
-        if len(self.gesture_history) > GESTURE_SMOOTHING_FRAMES:
-            self.gesture_history.pop(0)
-        
+        self._gesture_counts[gesture] += 1
+
         if len(self.gesture_history) >= GESTURE_SMOOTHING_FRAMES:
-            gesture = max(set(self.gesture_history), key=self.gesture_history.count)
+            gesture = self._gesture_counts.most_common(1)[0][0]
         
         if gesture != self.current_gesture:
             self.current_gesture = gesture
@@ -285,14 +593,25 @@ class HandTracker:
             return frame
         
         try:
-            if self.method == "cvzone":
-                frame, _ = self.detector.findHands(frame, draw=True)
+            if self.method in ("cvzone", "mediapipe_tasks"):
+                # Render the cached landmarks manually instead of re-running
+                # the detection pass (cvzone) or depending on the solutions
+                # drawing utils (Tasks API)
+                if self._last_lmlist is None or self._last_frame_shape is None:
+                    return frame
+                sy = frame.shape[0] / self._last_frame_shape[0]
+                sx = frame.shape[1] / self._last_frame_shape[1]
+                pts = [(int(lm[0] * sx), int(lm[1] * sy)) for lm in self._last_lmlist]
+                for a, b in self.HAND_CONNECTIONS:
+                    cv2.line(frame, pts[a], pts[b], (0, 255, 255), 2, cv2.LINE_AA)
+                for pt in pts:
+                    cv2.circle(frame, pt, 3, (0, 255, 0), -1, cv2.LINE_AA)
             elif self.method == "mediapipe_legacy" and hands:
                 for landmarks in hands:
                     self.mp_draw.draw_landmarks(
                         frame, landmarks, self.mp_hands.HAND_CONNECTIONS,
-                        self.mp_draw.DrawingSpec(color=(0, 255, 0), thickness=2, circle_radius=2),
-                        self.mp_draw.DrawingSpec(color=(0, 255, 255), thickness=2)
+                        self._landmark_spec,
+                        self._connection_spec
                     )
         except Exception as e:
             pass  # Silently handle drawing errors
@@ -301,8 +620,17 @@ class HandTracker:
     
     def release(self):
         """Release resources."""
-        if self.method == "mediapipe_legacy" and self.detector:
+        if self._worker_thread is not None and self._worker_thread.is_alive():
+            # Drain any pending frame, then signal the worker to exit
+            try:
+                self._in_queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._in_queue.put(None)
+            self._worker_thread.join(timeout=1.0)
+        if self.method in ("mediapipe_legacy", "mediapipe_tasks") and self.detector:
             try:
                 self.detector.close()
             except:
                 pass
+            _drop_shared_detector()
@@ -7,7 +7,7 @@ import cv2
 import numpy as np
 from typing import Tuple, Optional, Dict
 from config import *
-from utils import draw_rounded_rectangle, draw_text_with_background
+from utils import draw_rounded_rectangle, draw_text_with_background, is_points_in_rects
 
 
 class Toolbar:
@@ -23,20 +23,17 @@ class Toolbar:
         self.canvas_width = canvas_width
         self.height = TOOLBAR_HEIGHT
         
-        # Calculate color swatch positions
-        self.color_swatches = {}
+        # Swatch geometry as parallel lists instead of a dict-of-dicts:
+        # everything downstream (rendering, hit-testing) walks them with
+        # plain zips and no per-swatch key lookups
         start_x = TOOLBAR_PADDING + COLOR_SWATCH_RADIUS
         spacing = (canvas_width - 2 * TOOLBAR_PADDING - BUTTON_SECTION_WIDTH) // len(COLORS)
-        
-        for i, (name, color) in enumerate(COLORS.items()):
-            x = start_x + i * spacing
-            y = TOOLBAR_HEIGHT // 2
-            self.color_swatches[name] = {
-                'position': (x, y),
-                'color': color,
-                'radius': COLOR_SWATCH_RADIUS
-            }
-        
+        self._swatch_names = list(COLORS.keys())
+        self._swatch_pos = [(start_x + i * spacing, TOOLBAR_HEIGHT // 2)
+                            for i in range(len(COLORS))]
+        self._swatch_radius = COLOR_SWATCH_RADIUS
+
+
         # Button positions (right side of toolbar)
         button_start_x = canvas_width - TOOLBAR_PADDING - 3 * (BUTTON_WIDTH + 10)
         self.buttons = {
@@ -44,53 +41,134 @@ class Toolbar:
             'Redo': (button_start_x + BUTTON_WIDTH + 10, TOOLBAR_PADDING + 10),
             'Clear': (button_start_x + 2 * (BUTTON_WIDTH + 10), TOOLBAR_PADDING + 10)
         }
-    
+
+        # Button rectangles packed for the batched hit-test predicate
+        self._button_names = list(self.buttons.keys())
+        self._button_rects = np.asarray(
+            [[x, y, x + BUTTON_WIDTH, y + BUTTON_HEIGHT - 20]
+             for x, y in self.buttons.values()], dtype=np.int32)
+
+        # Swatch centers/radii as arrays so hit-testing is a single
+        # vectorized squared-distance comparison instead of a per-swatch loop
+        self._swatch_cx = np.array([p[0] for p in self._swatch_pos], dtype=np.int32)
+        self._swatch_cy = np.array([p[1] for p in self._swatch_pos], dtype=np.int32)
+        self._swatch_r2 = np.full(len(COLORS), COLOR_SWATCH_RADIUS ** 2, dtype=np.int32)
+        self._swatch_colors = list(COLORS.values())
+
+        # Fully rendered toolbar strips cached per (color, size) selection,
+        # each with a mask of its widget pixels (swatches, labels, buttons,
+        # highlight ring) so draw() can re-stamp them opaquely after the
+        # translucent band blend. The strip extends a few rows past
+        # TOOLBAR_HEIGHT so swatch label descenders are not clipped.
+        self._strip_height = TOOLBAR_HEIGHT + 12
+        self._strip_cache: Dict[Tuple[Tuple[int, int, int], int],
+                                Tuple[np.ndarray, np.ndarray]] = {}
+        # Static layer shared by every cached strip: background, swatches,
+        # labels and buttons never change, so they are rasterized exactly once
+        # here and each cache miss only adds the selection highlight on top.
+        self._static_strip = self._render_static_strip()
+        # Glyph mask for the label descender rows below the bar: the blit in
+        # draw() only touches actual glyph pixels there, so canvas strokes in
+        # those rows stay visible (the highlight ring never reaches them, so
+        # the mask is the same for every cached strip)
+        self._overflow_mask = (
+            self._static_strip[self.height:] !=
+            np.array(CANVAS_BG_COLOR, dtype=np.uint8)
+        ).any(axis=2)[..., None]
+
     def draw(self, frame: np.ndarray, current_color: Tuple[int, int, int],
              current_size: int) -> np.ndarray:
         """
         Draw the toolbar on the frame.
-        
+
         Args:
             frame: Frame to draw on
             current_color: Currently selected color
             current_size: Currently selected brush size
-        
+
         Returns:
             Frame with toolbar drawn
         """
-        # Draw toolbar background
-        toolbar_overlay = frame.copy()
-        cv2.rectangle(toolbar_overlay, (0, 0), (self.canvas_width, self.height),
-                     TOOLBAR_BG_COLOR, -1)
-        cv2.addWeighted(toolbar_overlay, 0.9, frame, 0.1, 0, frame)
-        
-        # Draw color swatches
-        for name, swatch in self.color_swatches.items():
-            pos = swatch['position']
-            color = swatch['color']
-            radius = swatch['radius']
-            
-            # Draw color circle
-            cv2.circle(frame, pos, radius, color, -1)
-            cv2.circle(frame, pos, radius, (200, 200, 200), 2, cv2.LINE_AA)
-            
-            # Highlight selected color
+        key = (current_color, current_size)
+        entry = self._strip_cache.get(key)
+        if entry is None:
+            strip = self._render_strip(current_color)
+            # Widget pixels (anything that is not plain band background) are
+            # re-stamped opaquely after the blend below; computed per strip
+            # because the highlight ring moves with the selected color
+            widget_mask = (
+                strip[:self.height] !=
+                np.array(TOOLBAR_BG_COLOR, dtype=np.uint8)
+            ).any(axis=2)[..., None]
+            entry = (strip, widget_mask)
+            self._strip_cache[key] = entry
+        strip, widget_mask = entry
+
+        # Blend the cached toolbar band into the frame in place - restores
+        # the translucent look over canvas strokes without any per-frame
+        # full-frame copy, and writes straight into the frame via dst=
+        cv2.addWeighted(strip[:self.height], 0.9, frame[:self.height], 0.1, 0,
+                        dst=frame[:self.height])
+        # Re-stamp swatches, labels and buttons at full opacity so they
+        # render their true colors regardless of strokes under the bar;
+        # only the plain band background keeps the translucent look
+        np.copyto(frame[:self.height], strip[:self.height], where=widget_mask)
+        # Label descender rows below the band: masked copy of the glyph
+        # pixels only, leaving canvas content in those rows intact
+        np.copyto(frame[self.height:self._strip_height],
+                  strip[self.height:], where=self._overflow_mask)
+        return frame
+
+    def _render_strip(self, current_color: Tuple[int, int, int]) -> np.ndarray:
+        """Render the toolbar strip for one selected color (cached by draw).
+
+        Copies the shared static layer and draws only the highlight ring
+        around the selected swatch.
+        """
+        strip = self._static_strip.copy()
+        for pos, color in zip(self._swatch_pos, self._swatch_colors):
             if color == current_color:
-                cv2.circle(frame, pos, radius + 5, HIGHLIGHT_COLOR, 3, cv2.LINE_AA)
-            
+                cv2.circle(strip, pos, self._swatch_radius + 5,
+                           HIGHLIGHT_COLOR, 3, cv2.LINE_AA)
+                break
+        return strip
+
+    def _render_static_strip(self) -> np.ndarray:
+        """Rasterize the invariant toolbar pixels once at construction."""
+        strip = np.empty((self._strip_height, self.canvas_width, 3), dtype=np.uint8)
+        # The band is blended into the frame at draw time, so it is stored at
+        # full opacity here; the label overflow rows below it match the
+        # canvas background
+        strip[:self.height] = TOOLBAR_BG_COLOR
+        strip[self.height:] = CANVAS_BG_COLOR
+
+        # Draw color swatches - cv2 attributes are bound locally so the loop
+        # body stays free of repeated module lookups
+        circle = cv2.circle
+        put_text = cv2.putText
+        get_text_size = cv2.getTextSize
+        font = cv2.FONT_HERSHEY_SIMPLEX
+        radius = self._swatch_radius
+        for name, pos, color in zip(self._swatch_names, self._swatch_pos,
+                                    self._swatch_colors):
+            # Draw color circle
+            circle(strip, pos, radius, color, -1)
+            circle(strip, pos, radius, (200, 200, 200), 2, cv2.LINE_AA)
+
             # Draw color name below
-            (text_width, _), _ = cv2.getTextSize(name, cv2.FONT_HERSHEY_SIMPLEX, 0.4, 1)
-            cv2.putText(frame, name, 
-                       (pos[0] - text_width // 2, pos[1] + radius + 15),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.4, TEXT_COLOR, 1, cv2.LINE_AA)
-        
+            (text_width, _), _ = get_text_size(name, font, 0.4, 1)
+            put_text(strip, name,
+                     (pos[0] - text_width // 2, pos[1] + radius + 15),
+                     font, 0.4, TEXT_COLOR, 1, cv2.LINE_AA)
+
+
         # Draw control buttons
         for button_name, pos in self.buttons.items():
             x, y = pos
             
             # Draw button background
             draw_rounded_rectangle(
-                frame,
+                strip,
                 (x, y),
                 (x + BUTTON_WIDTH, y + BUTTON_HEIGHT - 20),
                 (80, 80, 80),
@@ -100,7 +178,7 @@ class Toolbar:
             
             # Draw button border
             draw_rounded_rectangle(
-                frame,
+                strip,
                 (x, y),
                 (x + BUTTON_WIDTH, y + BUTTON_HEIGHT - 20),
                 (150, 150, 150),
@@ -114,11 +192,11 @@ class Toolbar:
             )
             text_x = x + (BUTTON_WIDTH - text_width) // 2
             text_y = y + (BUTTON_HEIGHT - 20 + text_height) // 2
-            cv2.putText(frame, button_name, (text_x, text_y),
+            cv2.putText(strip, button_name, (text_x, text_y),
                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, TEXT_COLOR, 1, cv2.LINE_AA)
-        
-        return frame
-    
+
+        return strip
+
     def get_color_at_position(self, x: int, y: int) -> Optional[Tuple[int, int, int]]:
         """
         Get the color of the swatch at the given position.
@@ -130,13 +208,13 @@ class Toolbar:
         Returns:
             Color if position is on a swatch, None otherwise
         """
-        for name, swatch in self.color_swatches.items():
-            pos = swatch['position']
-            radius = swatch['radius']
-            distance = np.sqrt((x - pos[0])**2 + (y - pos[1])**2)
-            if distance <= radius:
-                return swatch['color']
-        return None
+        # Squared-distance comparison across all swatches at once - no sqrt,
+        # no per-swatch Python iteration
+        dx = self._swatch_cx - x
+        dy = self._swatch_cy - y
+        hit = dx * dx + dy * dy <= self._swatch_r2
+        idx = int(np.argmax(hit))
+        return self._swatch_colors[idx] if hit[idx] else None
     
     def get_button_at_position(self, x: int, y: int) -> Optional[str]:
         """
@@ -149,11 +227,10 @@ class Toolbar:
         Returns:
             Button name if position is on a button, None otherwise
         """
-        for button_name, pos in self.buttons.items():
-            bx, by = pos
-            if bx <= x <= bx + BUTTON_WIDTH and by <= y <= by + BUTTON_HEIGHT - 20:
-                return button_name
-        return None
+        # One vectorized containment test across all buttons
+        hit = is_points_in_rects((x, y), self._button_rects)
+        idx = int(np.argmax(hit))
+        return self._button_names[idx] if hit[idx] else None
 
 
 class CameraPreview:
@@ -171,34 +248,44 @@ class CameraPreview:
         self.position = position
         self.width = width
         self.height = height
-    
+        # Reused destination buffer so the per-frame resize never allocates
+        self._thumb = np.empty((height, width, 3), dtype=np.uint8)
+
     def draw(self, frame: np.ndarray, camera_frame: np.ndarray,
-             hand_landmarks=None, hand_tracker=None) -> np.ndarray:
+             hand_landmarks=None, hand_tracker=None,
+             gesture: str = "None") -> np.ndarray:
         """
         Draw the camera preview on the frame.
-        
+
         Args:
             frame: Main canvas frame
             camera_frame: Camera feed frame
             hand_landmarks: Hand landmarks from MediaPipe
             hand_tracker: HandTracker instance for drawing landmarks
-        
+            gesture: Current gesture, used to skip landmark drawing mid-stroke
+
         Returns:
             Frame with camera preview drawn
         """
-        # Resize camera frame to preview size
-        preview = cv2.resize(camera_frame, (self.width, self.height))
-        
-        # Draw hand landmarks on preview
-        if hand_landmarks and hand_tracker:
+        # Resize camera frame into the preallocated preview buffer.
+        # INTER_AREA is both the right filter for downscaling and cheaper
+        # than the default INTER_LINEAR.
+        cv2.resize(camera_frame, (self.width, self.height), dst=self._thumb,
+                   interpolation=cv2.INTER_AREA)
+        preview = self._thumb
+
+        # Draw hand landmarks on preview - skipped entirely when disabled,
+        # and while actively drawing, where the preview is not the focus
+        if (SHOW_LANDMARKS and gesture in LANDMARK_DRAW_GESTURES
+                and hand_landmarks and hand_tracker):
             preview = hand_tracker.draw_landmarks(preview, hand_landmarks)
-        
+
         # Draw border around preview
         cv2.rectangle(preview, (0, 0), (self.width - 1, self.height - 1),
                      HIGHLIGHT_COLOR, 3)
-        
+
         # Overlay preview on main frame
         x, y = self.position
-        frame[y:y+self.height, x:x+self.width] = preview
-        
+        np.copyto(frame[y:y+self.height, x:x+self.width], preview)
+
         return frame
@@ -3,23 +3,71 @@ Utility functions for Air Canvas application.
 Contains helper functions for calculations, drawing, and UI operations.
 """
 
+import functools
+import math
 import numpy as np
 import cv2
-from typing import Tuple, List
+from collections import deque, namedtuple
+from typing import Deque, Tuple, List
+from filters import njit
 
 
 def calculate_distance(point1: Tuple[float, float], point2: Tuple[float, float]) -> float:
     """
     Calculate Euclidean distance between two points.
-    
+
     Args:
         point1: First point (x, y)
         point2: Second point (x, y)
-    
+
     Returns:
         Distance between the points
     """
-    return np.sqrt((point1[0] - point2[0])**2 + (point1[1] - point2[1])**2)
+    # math.hypot is pure C on scalars; np.sqrt would pay ufunc dispatch and
+    # a ndarray round-trip for every per-frame call
+    return math.hypot(point1[0] - point2[0], point1[1] - point2[1])
+
+
+def calculate_distances(points_a: np.ndarray, points_b: np.ndarray) -> np.ndarray:
+    """
+    Calculate element-wise Euclidean distances between two point arrays.
+
+    Args:
+        points_a: First (N, 2) array of points
+        points_b: Second (N, 2) array of points
+
+    Returns:
+        (N,) array of distances
+    """
+    diff = points_a - points_b
+    return np.hypot(diff[..., 0], diff[..., 1])
+
+
+@njit(cache=True, fastmath=True)
+def _sq_dist(x1: float, y1: float, x2: float, y2: float) -> float:
+    """Squared distance between two points (JIT-compiled when Numba is installed)."""
+    dx = x1 - x2
+    dy = y1 - y2
+    return dx * dx + dy * dy
+
+
+def distance_lt(point1: Tuple[float, float], point2: Tuple[float, float],
+                threshold: float) -> bool:
+    """
+    Check whether two points are closer than a threshold.
+
+    Compares squared distances, so no square root is taken; use this instead
+    of calculate_distance wherever the result is only compared to a constant.
+
+    Args:
+        point1: First point (x, y)
+        point2: Second point (x, y)
+        threshold: Distance threshold
+
+    Returns:
+        True if the points are strictly closer than threshold
+    """
+    return _sq_dist(point1[0], point1[1], point2[0], point2[1]) < threshold * threshold
 
 
 def smooth_points(points: List[Tuple[int, int]], window_size: int = 3) -> List[Tuple[int, int]]:
@@ -33,20 +81,220 @@ def smooth_points(points: List[Tuple[int, int]], window_size: int = 3) -> List[T
     Returns:
         Smoothed list of points
     """
-    if len(points) < window_size:
+    n = len(points)
+    if n < window_size:
         return points
-    
-    smoothed = []
-    for i in range(len(points)):
-        start = max(0, i - window_size // 2)
-        end = min(len(points), i + window_size // 2 + 1)
-        window = points[start:end]
-        
-        avg_x = sum(p[0] for p in window) / len(window)
-        avg_y = sum(p[1] for p in window) / len(window)
-        smoothed.append((int(avg_x), int(avg_y)))
-    
-    return smoothed
+
+    # Prefix-sum sliding window: each window mean is one subtraction and one
+    # division on the cumulative sums, O(N) total instead of O(N*W) Python
+    # loops building per-window lists
+    arr = np.asarray(points, dtype=np.int64)
+    csum = np.concatenate([np.zeros((1, 2), dtype=np.int64), arr.cumsum(axis=0)])
+    idx = np.arange(n)
+    starts = np.maximum(0, idx - window_size // 2)
+    ends = np.minimum(n, idx + window_size // 2 + 1)
+    sums = csum[ends] - csum[starts]
+    counts = (ends - starts)[:, None]
+    out = (sums / counts).astype(np.int64)
+    return list(map(tuple, out.tolist()))
+
+
+class Trail:
+    """Structure-of-arrays point trail.
+
+    Stores x and y in separate preallocated int32 columns (doubled on
+    overflow), so smoothing, distance and drawing kernels read contiguous
+    arrays instead of converting a list of boxed tuples per frame.
+    """
+
+    # Initial capacity of the column buffers; doubled on overflow
+    _INITIAL_CAPACITY = 64
+
+    def __init__(self):
+        self._xs = np.empty(self._INITIAL_CAPACITY, dtype=np.int32)
+        self._ys = np.empty(self._INITIAL_CAPACITY, dtype=np.int32)
+        self._n = 0
+
+    def __len__(self) -> int:
+        return self._n
+
+    @property
+    def xs(self) -> np.ndarray:
+        """The x column as an int32 array view."""
+        return self._xs[:self._n]
+
+    @property
+    def ys(self) -> np.ndarray:
+        """The y column as an int32 array view."""
+        return self._ys[:self._n]
+
+    def append(self, x: int, y: int):
+        """Append a point, growing the column buffers as needed."""
+        if self._n == len(self._xs):
+            self._xs = np.concatenate([self._xs, np.empty_like(self._xs)])
+            self._ys = np.concatenate([self._ys, np.empty_like(self._ys)])
+        self._xs[self._n] = x
+        self._ys[self._n] = y
+        self._n += 1
+
+    def as_points(self) -> np.ndarray:
+        """The trail as an (N, 2) int32 array (copies into packed form)."""
+        return np.column_stack((self.xs, self.ys))
+
+    def clear(self):
+        """Drop all points, keeping the allocated buffers."""
+        self._n = 0
+
+
+@njit(cache=True)
+def _ema_kernel(values: np.ndarray, alpha: float) -> np.ndarray:
+    """One-pole EMA over a 1-D float array (JIT-compiled when Numba is installed)."""
+    out = np.empty_like(values)
+    acc = values[0]
+    out[0] = acc
+    for i in range(1, len(values)):
+        acc = alpha * values[i] + (1.0 - alpha) * acc
+        out[i] = acc
+    return out
+
+
+def ema_smooth(points: List[Tuple[int, int]], alpha: float = 0.4) -> List[Tuple[int, int]]:
+    """
+    Apply exponential moving-average smoothing to a list of points.
+
+    A causal one-pole filter: cheaper than a windowed mean (one multiply-add
+    per sample, no window buffer) and with zero lookahead, which suits live
+    ink better than smooth_points.
+
+    Args:
+        points: List of (x, y) coordinates
+        alpha: Smoothing factor (0-1); higher follows the input more closely
+
+    Returns:
+        Smoothed list of points
+    """
+    if len(points) < 2:
+        return points
+    arr = np.asarray(points, dtype=np.float64)
+    xs = _ema_kernel(np.ascontiguousarray(arr[:, 0]), alpha)
+    ys = _ema_kernel(np.ascontiguousarray(arr[:, 1]), alpha)
+    return list(zip(xs.astype(np.int64).tolist(), ys.astype(np.int64).tolist()))
+
+
+class EMASmoother:
+    """Streaming one-pole EMA for points arriving one per frame.
+
+    O(1) state and two multiply-adds per push; the lower-latency
+    alternative to StreamingSmoother's windowed mean.
+    """
+
+    def __init__(self, alpha: float = 0.4):
+        """
+        Initialize the smoother.
+
+        Args:
+            alpha: Smoothing factor (0-1); higher follows the input more closely
+        """
+        self.alpha = alpha
+        self._x: float = 0.0
+        self._y: float = 0.0
+        self._primed = False
+
+    def push(self, point: Tuple[int, int]) -> Tuple[int, int]:
+        """
+        Add a point and return the current smoothed point.
+
+        Args:
+            point: New (x, y) point
+
+        Returns:
+            Exponentially smoothed (x, y)
+        """
+        if not self._primed:
+            self._x, self._y = float(point[0]), float(point[1])
+            self._primed = True
+        else:
+            a = self.alpha
+            self._x = a * point[0] + (1.0 - a) * self._x
+            self._y = a * point[1] + (1.0 - a) * self._y
+        return int(self._x), int(self._y)
+
+    def reset(self):
+        """Forget the filter state (call when a new stroke starts)."""
+        self._primed = False
+
+
+def draw_trail(img: np.ndarray, points, color: Tuple[int, int, int],
+               thickness: int = 2, anti_alias: bool = True) -> None:
+    """
+    Draw a point trail as a single polyline.
+
+    One cv2.polylines call renders every segment at once, instead of a
+    Python loop issuing one cv2.line call per segment.
+
+    Args:
+        img: Image array to draw on
+        points: Trail instance or (N, 2) array-like of points
+        color: Color in BGR format
+        thickness: Line thickness
+        anti_alias: Whether to draw anti-aliased segments
+    """
+    pts = points.as_points() if isinstance(points, Trail) else \
+        np.asarray(points, dtype=np.int32)
+    if len(pts) == 0:
+        return
+    if len(pts) == 1:
+        cv2.circle(img, (int(pts[0, 0]), int(pts[0, 1])), thickness, color, -1)
+        return
+    line_type = cv2.LINE_AA if anti_alias else cv2.LINE_8
+    cv2.polylines(img, [pts.reshape(-1, 1, 2)], False, color, thickness, line_type)
+
+
+class StreamingSmoother:
+    """Moving-average smoother for points arriving one per frame.
+
+    Keeps the window sums incrementally, so each new point costs two
+    additions and two subtractions instead of re-averaging the whole
+    history like smooth_points would.
+    """
+
+    def __init__(self, window_size: int = 3):
+        """
+        Initialize the smoother.
+
+        Args:
+            window_size: Size of the smoothing window
+        """
+        self.window_size = window_size
+        self._buf: Deque[Tuple[int, int]] = deque(maxlen=window_size)
+        self._sum_x = 0
+        self._sum_y = 0
+
+    def push(self, point: Tuple[int, int]) -> Tuple[int, int]:
+        """
+        Add a point and return the current smoothed point.
+
+        Args:
+            point: New (x, y) point
+
+        Returns:
+            Moving average of the points currently in the window
+        """
+        if len(self._buf) == self.window_size:
+            old_x, old_y = self._buf[0]
+            self._sum_x -= old_x
+            self._sum_y -= old_y
+        self._buf.append(point)
+        self._sum_x += point[0]
+        self._sum_y += point[1]
+        n = len(self._buf)
+        return self._sum_x // n, self._sum_y // n
+
+    def reset(self):
+        """Clear the window (call when a new stroke starts)."""
+        self._buf.clear()
+        self._sum_x = 0
+        self._sum_y = 0
 
 
 def draw_rounded_rectangle(img: np.ndarray, top_left: Tuple[int, int], 
@@ -65,11 +313,27 @@ def draw_rounded_rectangle(img: np.ndarray, top_left: Tuple[int, int],
     """
     x1, y1 = top_left
     x2, y2 = bottom_right
-    
-    # Draw rectangles for the main body
+
+    if thickness < 0:
+        # Filled case: one octagonal fillPoly for the body plus four corner
+        # quadrants - half the draw calls of the old 2-rect + 4-circle
+        # version and no overdraw of the shared center band
+        pts = np.array([
+            [x1 + radius, y1], [x2 - radius, y1], [x2, y1 + radius],
+            [x2, y2 - radius], [x2 - radius, y2], [x1 + radius, y2],
+            [x1, y2 - radius], [x1, y1 + radius]
+        ], dtype=np.int32)
+        cv2.fillPoly(img, [pts], color)
+        cv2.ellipse(img, (x1 + radius, y1 + radius), (radius, radius), 0, 180, 270, color, -1)
+        cv2.ellipse(img, (x2 - radius, y1 + radius), (radius, radius), 0, 270, 360, color, -1)
+        cv2.ellipse(img, (x2 - radius, y2 - radius), (radius, radius), 0, 0, 90, color, -1)
+        cv2.ellipse(img, (x1 + radius, y2 - radius), (radius, radius), 0, 90, 180, color, -1)
+        return
+
+    # Outlined case: rectangles for the straight edges
     cv2.rectangle(img, (x1 + radius, y1), (x2 - radius, y2), color, thickness)
     cv2.rectangle(img, (x1, y1 + radius), (x2, y2 - radius), color, thickness)
-    
+
     # Draw circles for rounded corners
     cv2.circle(img, (x1 + radius, y1 + radius), radius, color, thickness)
     cv2.circle(img, (x2 - radius, y1 + radius), radius, color, thickness)
@@ -77,6 +341,50 @@ def draw_rounded_rectangle(img: np.ndarray, top_left: Tuple[int, int],
     cv2.circle(img, (x2 - radius, y2 - radius), radius, color, thickness)
 
 
+@functools.lru_cache(maxsize=256)
+def _text_size(text: str, font: int, font_scale: float, thickness: int):
+    """Memoized cv2.getTextSize: HUD labels repeat every frame."""
+    return cv2.getTextSize(text, font, font_scale, thickness)
+
+
+@functools.lru_cache(maxsize=32)
+def _panel_cache(width: int, height: int, radius: int,
+                 color: Tuple[int, int, int], thickness: int):
+    """Rasterize one rounded-rectangle panel and its coverage mask once."""
+    panel = np.zeros((height, width, 3), dtype=np.uint8)
+    draw_rounded_rectangle(panel, (0, 0), (width - 1, height - 1),
+                           color, thickness, radius)
+    coverage = np.zeros((height, width, 3), dtype=np.uint8)
+    draw_rounded_rectangle(coverage, (0, 0), (width - 1, height - 1),
+                           (255, 255, 255), thickness, radius)
+    return panel, coverage.astype(bool)
+
+
+def draw_panel(img: np.ndarray, top_left: Tuple[int, int], width: int, height: int,
+               color: Tuple[int, int, int], thickness: int = -1,
+               radius: int = 10) -> None:
+    """
+    Blit a cached rounded-rectangle panel onto an image.
+
+    Each distinct (width, height, radius, color, thickness) combination is
+    rasterized once and reused, so repeated UI panels cost a masked copy
+    instead of six rasterizer passes per frame.
+
+    Args:
+        img: Image array to draw on
+        top_left: Top-left corner (x, y)
+        width: Panel width
+        height: Panel height
+        color: Color in BGR format
+        thickness: Line thickness (-1 for filled)
+        radius: Corner radius
+    """
+    panel, mask = _panel_cache(width, height, radius, tuple(color), thickness)
+    x, y = top_left
+    # The mask keeps the pixels outside the rounded corners untouched
+    np.copyto(img[y:y+height, x:x+width], panel, where=mask)
+
+
 def draw_text_with_background(img: np.ndarray, text: str, position: Tuple[int, int],
                                font_scale: float = 0.6, color: Tuple[int, int, int] = (255, 255, 255),
                                bg_color: Tuple[int, int, int] = (0, 0, 0),
@@ -96,8 +404,8 @@ def draw_text_with_background(img: np.ndarray, text: str, position: Tuple[int, i
     font = cv2.FONT_HERSHEY_SIMPLEX
     thickness = 1
     
-    # Get text size
-    (text_width, text_height), baseline = cv2.getTextSize(text, font, font_scale, thickness)
+    # Get text size (memoized - the same labels are laid out every frame)
+    (text_width, text_height), baseline = _text_size(text, font, font_scale, thickness)
     
     # Draw background rectangle
     x, y = position
@@ -110,6 +418,59 @@ def draw_text_with_background(img: np.ndarray, text: str, position: Tuple[int, i
     cv2.putText(img, text, (x, y), font, font_scale, color, thickness, cv2.LINE_AA)
 
 
+# Prerendered glyph tiles for the FPS counter: every character the HUD string
+# can contain, rasterized once on first use and blitted per frame
+_FPS_FONT = cv2.FONT_HERSHEY_SIMPLEX
+_FPS_SCALE = 0.6
+_FPS_CHARSET = "0123456789.:FPS "
+_glyph_tiles: dict = {}
+
+
+def _build_glyph_atlas():
+    """Rasterize each HUD character into a tile sharing one baseline."""
+    ascent = descent = 0
+    for char in _FPS_CHARSET:
+        (_, h), baseline = cv2.getTextSize(char, _FPS_FONT, _FPS_SCALE, 1)
+        ascent = max(ascent, h)
+        descent = max(descent, baseline)
+    for char in _FPS_CHARSET:
+        (w, _), _ = cv2.getTextSize(char, _FPS_FONT, _FPS_SCALE, 1)
+        tile = np.zeros((ascent + descent, max(w, 4) + 1, 3), dtype=np.uint8)
+        cv2.putText(tile, char, (0, ascent), _FPS_FONT, _FPS_SCALE,
+                    (255, 255, 255), 1, cv2.LINE_AA)
+        _glyph_tiles[char] = tile
+
+
+def draw_fps(img: np.ndarray, fps: float, position: Tuple[int, int]) -> None:
+    """
+    Draw an "FPS: NN.N" counter from prerendered glyph tiles.
+
+    cv2.putText re-rasterizes every Hershey stroke each frame; here each
+    character was rendered once into a tile, so the whole counter costs a
+    handful of small slice copies (white text on black, HUD style).
+
+    Args:
+        img: Image array to draw on
+        fps: Frames-per-second value to display
+        position: Top-left position (x, y) of the counter
+    """
+    if not _glyph_tiles:
+        _build_glyph_atlas()
+    x, y = position
+    img_h, img_w = img.shape[:2]
+    for char in f"FPS: {fps:.1f}":
+        tile = _glyph_tiles[char]
+        h, w = tile.shape[:2]
+        # Clip each tile to the image, like overlay_transparent above;
+        # an unclipped slice assignment would raise at the edges
+        th = min(h, img_h - y)
+        tw = min(w, img_w - x)
+        if th <= 0 or tw <= 0:
+            break
+        img[y:y+th, x:x+tw] = tile[:th, :tw]
+        x += w
+
+
 def is_point_in_rect(point: Tuple[int, int], rect_top_left: Tuple[int, int],
                      rect_bottom_right: Tuple[int, int]) -> bool:
     """
@@ -129,6 +490,22 @@ def is_point_in_rect(point: Tuple[int, int], rect_top_left: Tuple[int, int],
     return x1 <= x <= x2 and y1 <= y <= y2
 
 
+def is_points_in_rects(point: Tuple[int, int], rects: np.ndarray) -> np.ndarray:
+    """
+    Check one point against many rectangles at once.
+
+    Args:
+        point: Point (x, y)
+        rects: (M, 4) array of [x1, y1, x2, y2] rectangles
+
+    Returns:
+        (M,) boolean mask, True where the point lies inside the rectangle
+    """
+    x, y = point
+    return ((rects[:, 0] <= x) & (x <= rects[:, 2]) &
+            (rects[:, 1] <= y) & (y <= rects[:, 3]))
+
+
 def normalize_coordinates(x: float, y: float, width: int, height: int) -> Tuple[int, int]:
     """
     Convert normalized coordinates (0-1) to pixel coordinates.
@@ -145,23 +522,46 @@ def normalize_coordinates(x: float, y: float, width: int, height: int) -> Tuple[
     return int(x * width), int(y * height)
 
 
-def overlay_transparent(background: np.ndarray, overlay: np.ndarray, 
-                        position: Tuple[int, int], alpha: float = 0.7) -> np.ndarray:
+def normalize_coordinates_batch(xy: np.ndarray, width: int, height: int) -> np.ndarray:
+    """
+    Convert an array of normalized coordinates (0-1) to pixel coordinates.
+
+    One broadcast multiply covers a whole landmark set, instead of 21
+    scalar normalize_coordinates calls per detected hand.
+
+    Args:
+        xy: (N, 2) array of normalized (x, y) coordinates
+        width: Image width
+        height: Image height
+
+    Returns:
+        (N, 2) int32 array of pixel coordinates
+    """
+    return (xy * (width, height)).astype(np.int32)
+
+
+# Reused uint16 scratch planes for overlay_transparent, regrown only when an
+# overlay larger than any seen before comes through
+_blend_scratch: List[np.ndarray] = []
+
+
+def overlay_transparent(background: np.ndarray, overlay: np.ndarray,
+                        position: Tuple[int, int], alpha: float = 0.7) -> None:
     """
     Overlay an image on top of another with transparency.
-    
+
+    Blends in place, mutating background - like the mutating cv2 drawing
+    calls - so callers never treat the result as a possibly-new array.
+
     Args:
-        background: Background image
+        background: Background image (mutated)
         overlay: Overlay image
         position: Position to place overlay (x, y)
         alpha: Transparency factor (0-1)
-    
-    Returns:
-        Combined image
     """
     x, y = position
     h, w = overlay.shape[:2]
-    
+
     # Ensure the overlay fits within the background
     if x + w > background.shape[1]:
         w = background.shape[1] - x
@@ -169,10 +569,106 @@ def overlay_transparent(background: np.ndarray, overlay: np.ndarray,
     if y + h > background.shape[0]:
         h = background.shape[0] - y
         overlay = overlay[:h, :]
-    
-    # Blend the overlay
+
+    _blend_into(background[y:y+h, x:x+w], overlay, alpha)
+
+
+def _blend_into(roi: np.ndarray, overlay: np.ndarray, alpha: float) -> None:
+    """Fixed-point constant-alpha blend of overlay into roi, in place.
+
+    Shared by overlay_transparent and overlay_transparent_fast. Alpha is
+    scaled to 0..256 so the whole mix is integer multiplies and a shift,
+    running on reused uint16 scratch planes - no LUT lookups, no
+    uint8->float->uint8 round-trip and no per-call allocation.
+    """
+    # Fast paths for the degenerate alphas: fully opaque is a plain copy,
+    # fully transparent touches nothing - callers toggling an overlay on/off
+    # pay no per-pixel arithmetic at all
+    if alpha >= 0.999:
+        np.copyto(roi, overlay)
+        return
+    if alpha <= 0.001:
+        return
+
+    a8 = int(round(alpha * 256))
+    inv = 256 - a8
+    h, w = roi.shape[:2]
+
+    if not _blend_scratch or _blend_scratch[0].shape[0] < h or _blend_scratch[0].shape[1] < w:
+        grow_h = max(h, _blend_scratch[0].shape[0]) if _blend_scratch else h
+        grow_w = max(w, _blend_scratch[0].shape[1]) if _blend_scratch else w
+        _blend_scratch[:] = [np.empty((grow_h, grow_w, 3), dtype=np.uint16),
+                             np.empty((grow_h, grow_w, 3), dtype=np.uint16)]
+    acc = _blend_scratch[0][:h, :w]
+    tmp = _blend_scratch[1][:h, :w]
+    np.multiply(roi, inv, out=acc, dtype=np.uint16)
+    np.multiply(overlay, a8, out=tmp, dtype=np.uint16)
+    acc += tmp
+    acc >>= 8
+    roi[:] = acc
+
+
+# Precomputed blit geometry for a static overlay: the destination slices and
+# the (clipped, contiguous) overlay view, so the per-frame blend skips all
+# bounds math and slicing
+OverlayBlit = namedtuple('OverlayBlit', ['rows', 'cols', 'view'])
+
+
+def register_overlay(background_shape: Tuple[int, ...], overlay: np.ndarray,
+                     position: Tuple[int, int]) -> OverlayBlit:
+    """
+    Precompute the clipped blit geometry for a static overlay.
+
+    Args:
+        background_shape: Shape of the background the overlay will be drawn on
+        overlay: Overlay image
+        position: Position to place overlay (x, y)
+
+    Returns:
+        OverlayBlit to pass to overlay_transparent_fast
+    """
+    x, y = position
+    h = min(overlay.shape[0], background_shape[0] - y)
+    w = min(overlay.shape[1], background_shape[1] - x)
+    return OverlayBlit(slice(y, y + h), slice(x, x + w),
+                       np.ascontiguousarray(overlay[:h, :w]))
+
+
+def overlay_transparent_fast(background: np.ndarray, blit: OverlayBlit,
+                             alpha: float = 0.7) -> None:
+    """
+    Blend a pre-registered overlay into the background, in place.
+
+    Args:
+        background: Background image (mutated)
+        blit: Precomputed geometry from register_overlay
+        alpha: Transparency factor (0-1)
+    """
+    _blend_into(background[blit.rows, blit.cols], blit.view, alpha)
+
+
+def overlay_bgra(background: np.ndarray, bgra: np.ndarray,
+                 position: Tuple[int, int]) -> None:
+    """
+    Composite a BGRA image onto a BGR background using its alpha channel.
+
+    Unlike overlay_transparent, which applies one constant alpha to the
+    whole overlay, this respects per-pixel alpha - icons with transparent
+    surroundings composite correctly without pre-flattening. The blend is
+    one pass of vectorized uint16 arithmetic, in place.
+
+    Args:
+        background: BGR background image (mutated)
+        bgra: BGRA overlay image
+        position: Position to place overlay (x, y)
+    """
+    x, y = position
+    h = min(bgra.shape[0], background.shape[0] - y)
+    w = min(bgra.shape[1], background.shape[1] - x)
+    bgra = bgra[:h, :w]
+
+    alpha = bgra[..., 3:].astype(np.uint16)
+    inv = 255 - alpha
+    fg = bgra[..., :3].astype(np.uint16)
     roi = background[y:y+h, x:x+w]
-    blended = cv2.addWeighted(roi, 1 - alpha, overlay, alpha, 0)
-    background[y:y+h, x:x+w] = blended
-    
-    return background
+    roi[:] = ((roi.astype(np.uint16) * inv + fg * alpha) // 255).astype(np.uint8)